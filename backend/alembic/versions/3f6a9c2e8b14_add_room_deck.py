@@ -0,0 +1,41 @@
+"""add room_deck and participants.deck_position
+
+Revision ID: 3f6a9c2e8b14
+Revises: e9b4d2f7a6c3
+Create Date: 2026-10-18 23:04:52.771036
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6a9c2e8b14'
+down_revision: Union[str, None] = 'e9b4d2f7a6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rooms get their deck on their next swipe
+    op.create_table('room_deck',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('room_id', 'movie_id', name='uq_room_deck_room_movie'),
+    sa.UniqueConstraint('room_id', 'position', name='uq_room_deck_room_position')
+    )
+    op.create_index(op.f('ix_room_deck_id'), 'room_deck', ['id'], unique=False)
+    op.add_column('participants', sa.Column('deck_position', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('participants', 'deck_position')
+    op.drop_index(op.f('ix_room_deck_id'), table_name='room_deck')
+    op.drop_table('room_deck')
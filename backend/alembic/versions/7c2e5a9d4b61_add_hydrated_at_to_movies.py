@@ -0,0 +1,28 @@
+"""add movies.hydrated_at
+
+Revision ID: 7c2e5a9d4b61
+Revises: 3f6a9c2e8b14
+Create Date: 2026-10-18 23:41:18.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5a9d4b61'
+down_revision: Union[str, None] = '3f6a9c2e8b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('movies', sa.Column('hydrated_at', sa.DateTime(timezone=True), nullable=True))
+    # Movies stored so far were written with their full TMDB details
+    op.execute("UPDATE movies SET hydrated_at = now() WHERE tmdb_id IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('movies', 'hydrated_at')
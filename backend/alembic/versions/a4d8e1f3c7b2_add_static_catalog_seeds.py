@@ -0,0 +1,32 @@
+"""add static_catalog_seeds
+
+Revision ID: a4d8e1f3c7b2
+Revises: 7c2e5a9d4b61
+Create Date: 2026-10-19 00:12:37.518244
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e1f3c7b2'
+down_revision: Union[str, None] = '7c2e5a9d4b61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Region/provider pairs seeded before are re-seeded once; existing availabilities are kept
+    op.create_table('static_catalog_seeds',
+    sa.Column('region', sa.String(length=2), nullable=False),
+    sa.Column('provider_id', sa.Integer(), nullable=False),
+    sa.Column('seeded_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('region', 'provider_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('static_catalog_seeds')
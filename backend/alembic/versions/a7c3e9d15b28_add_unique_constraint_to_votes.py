@@ -0,0 +1,56 @@
+"""add unique constraint to votes
+
+Revision ID: a7c3e9d15b28
+Revises: f2a8c61d7e94
+Create Date: 2026-10-18 21:02:11.348215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9d15b28'
+down_revision: Union[str, None] = 'f2a8c61d7e94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """One vote per (room, participant, movie), enabling INSERT ... ON CONFLICT.
+
+    Duplicates left by concurrent double-taps are removed first, keeping the
+    most recent vote, and matches that no longer hold are cleared.
+    """
+    op.execute(
+        sa.text("""
+            DELETE FROM votes
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM votes GROUP BY room_id, participant_id, movie_id
+            )
+        """)
+    )
+    op.execute(
+        sa.text("""
+            DELETE FROM room_matches
+            WHERE (
+                SELECT COUNT(DISTINCT v.participant_id) FROM votes v
+                WHERE v.room_id = room_matches.room_id
+                  AND v.movie_id = room_matches.movie_id
+                  AND v.liked = TRUE
+            ) < (
+                SELECT COUNT(*) FROM participants p WHERE p.room_id = room_matches.room_id
+            )
+        """)
+    )
+    op.create_unique_constraint(
+        'uq_votes_room_participant_movie',
+        'votes',
+        ['room_id', 'participant_id', 'movie_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_votes_room_participant_movie', 'votes', type_='unique')
@@ -0,0 +1,26 @@
+"""add token_key to rooms
+
+Revision ID: c81f4b6e2a97
+Revises: a7c3e9d15b28
+Create Date: 2026-10-18 21:47:30.612904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4b6e2a97'
+down_revision: Union[str, None] = 'a7c3e9d15b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('rooms', sa.Column('token_key', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('rooms', 'token_key')
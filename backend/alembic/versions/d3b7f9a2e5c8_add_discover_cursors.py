@@ -0,0 +1,34 @@
+"""add discover_cursors
+
+Revision ID: d3b7f9a2e5c8
+Revises: a4d8e1f3c7b2
+Create Date: 2026-10-19 00:47:03.861592
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3b7f9a2e5c8'
+down_revision: Union[str, None] = 'a4d8e1f3c7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pages ingested before start over from page 1 once; known movies are only looked up
+    op.create_table('discover_cursors',
+    sa.Column('region', sa.String(length=2), nullable=False),
+    sa.Column('provider_key', sa.String(length=200), nullable=False),
+    sa.Column('last_page', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_pages', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('region', 'provider_key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('discover_cursors')
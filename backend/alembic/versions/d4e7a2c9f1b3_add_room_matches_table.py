@@ -0,0 +1,52 @@
+"""add room_matches table
+
+Revision ID: d4e7a2c9f1b3
+Revises: b2c3d4e5f6a1
+Create Date: 2026-10-18 09:12:37.514220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e7a2c9f1b3'
+down_revision: Union[str, None] = 'b2c3d4e5f6a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('room_matches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('matched_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('room_id', 'movie_id')
+    )
+    op.create_index(op.f('ix_room_matches_id'), 'room_matches', ['id'], unique=False)
+
+    # Backfill matches that already exist in the votes table
+    op.execute(
+        sa.text("""
+            INSERT INTO room_matches (room_id, movie_id, matched_at)
+            SELECT v.room_id, v.movie_id, MAX(v.created_at)
+            FROM votes v
+            WHERE v.liked = TRUE
+            GROUP BY v.room_id, v.movie_id
+            HAVING COUNT(DISTINCT v.participant_id) >= 2
+               AND COUNT(DISTINCT v.participant_id) = (
+                   SELECT COUNT(*) FROM participants p WHERE p.room_id = v.room_id
+               )
+        """)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_room_matches_id'), table_name='room_matches')
+    op.drop_table('room_matches')
@@ -0,0 +1,57 @@
+"""add covering indexes to votes and movie_availabilities
+
+Revision ID: e9b4d2f7a6c3
+Revises: c81f4b6e2a97
+Create Date: 2026-10-18 22:31:05.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4d2f7a6c3'
+down_revision: Union[str, None] = 'c81f4b6e2a97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, key columns, included columns)
+INDEXES = [
+    (
+        'ix_votes_room_id_movie_id_liked',
+        'votes',
+        ['room_id', 'movie_id', 'liked'],
+        ['participant_id'],
+    ),
+    ('ix_votes_participant_id_movie_id', 'votes', ['participant_id', 'movie_id'], []),
+    (
+        'ix_movie_availabilities_region_provider_id',
+        'movie_availabilities',
+        ['region', 'provider_id', 'movie_id'],
+        [],
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps votes writable during the build, but cannot run in a transaction.
+    # A build that failed half-way leaves an invalid index behind; drop it and retry.
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS {name}'))
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
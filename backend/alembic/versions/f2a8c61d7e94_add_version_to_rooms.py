@@ -0,0 +1,26 @@
+"""add version to rooms
+
+Revision ID: f2a8c61d7e94
+Revises: d4e7a2c9f1b3
+Create Date: 2026-10-18 11:03:52.208117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c61d7e94'
+down_revision: Union[str, None] = 'd4e7a2c9f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('rooms', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('rooms', 'version')
@@ -2,8 +2,9 @@ import os
 from pathlib import Path
 
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./cinematch.db")
 
@@ -42,3 +43,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def dialect_insert(db: Session):
+    """``insert()`` of the session's dialect, which supports ``ON CONFLICT`` clauses."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
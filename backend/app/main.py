@@ -1,16 +1,36 @@
+import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from .database import init_db
-from .routers import movies, providers, rooms, votes
+from .database import SessionLocal, engine, init_db
+from .routers import movies, providers, realtime, rooms, votes
+from .services.events import broker
+from .services.hydration import hydrator
+from .services.query_stats import instrument, track_queries
+from .services.static_catalog import seed_static_catalog
+from .services.tmdb import TMDB_API_KEY
+from .services.vote_index import vote_index
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    if not TMDB_API_KEY:
+        # Rooms on other regions or providers are seeded on their first deck request
+        with SessionLocal() as db:
+            seed_static_catalog(db)
+    instrument(engine)
+    broker.start(engine)
+    hydrator.start()
     yield
+    hydrator.stop()
+    broker.stop()
+    vote_index.clear()
 
 
 app = FastAPI(title="CineMatch API", lifespan=lifespan)
@@ -23,12 +43,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def query_timing(request: Request, call_next):
+    """Report each request's SQL statement count and database time."""
+    started = time.perf_counter()
+    with track_queries() as stats:
+        response = await call_next(request)
+    total_ms = (time.perf_counter() - started) * 1000
+    response.headers["Server-Timing"] = f"{stats.server_timing()}, app;dur={total_ms:.2f}"
+    logger.debug(
+        f"{request.method} {request.url.path}: {stats.statements} statements, "
+        f"{stats.seconds * 1000:.1f}ms in the database, {total_ms:.1f}ms total"
+    )
+    return response
+
+
 app.include_router(rooms.router, prefix="/api/v1/rooms", tags=["rooms"])
 app.include_router(movies.router, prefix="/api/v1/movies", tags=["movies"])
 app.include_router(votes.router, prefix="/api/v1/votes", tags=["votes"])
 app.include_router(providers.router, prefix="/api/v1/providers", tags=["providers"])
+app.include_router(realtime.router, tags=["realtime"])
 
 
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/health/events")
+def room_events_health():
+    return broker.stats()
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -30,9 +31,15 @@ class Room(Base):
     is_active = Column(Boolean, default=True)
     region = Column(String(2), default="US")  # ISO 3166-1 alpha-2 country code
     provider_ids = Column(JSON, default=list)  # List of TMDB watch provider IDs [8] = [Netflix]
+    # Bumped by every write that changes what room reads return (votes, joins, pool top-ups)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Mixed into the room's token signing key; rotating it revokes issued tokens
+    token_key = Column(String(64), nullable=True)
 
     participants = relationship("Participant", back_populates="room", cascade="all, delete-orphan")
     votes = relationship("Vote", back_populates="room", cascade="all, delete-orphan")
+    matches = relationship("RoomMatch", back_populates="room", cascade="all, delete-orphan")
+    deck = relationship("RoomDeckCard", cascade="all, delete-orphan")
 
 
 class Participant(Base):
@@ -43,6 +50,8 @@ class Participant(Base):
     name = Column(String(50))
     session_id = Column(String(100))
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Deck position of the last card this participant swiped
+    deck_position = Column(Integer, nullable=False, default=0, server_default="0")
 
     # A user can join multiple rooms, but only once per room
     __table_args__ = (UniqueConstraint("room_id", "session_id"),)
@@ -60,10 +69,63 @@ class Vote(Base):
     liked = Column(Boolean)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # One vote per participant and movie; changing one's mind updates it in place.
+    # Its index also serves lookups by room_id alone.
+    __table_args__ = (
+        UniqueConstraint(
+            "room_id", "participant_id", "movie_id", name="uq_votes_room_participant_movie"
+        ),
+        # Match checks: who liked this movie in this room, answered from the index alone
+        Index(
+            "ix_votes_room_id_movie_id_liked",
+            "room_id",
+            "movie_id",
+            "liked",
+            postgresql_include=["participant_id"],
+        ),
+        # A participant's own votes, e.g. the movies left in their deck
+        Index("ix_votes_participant_id_movie_id", "participant_id", "movie_id"),
+    )
+
     room = relationship("Room", back_populates="votes")
     movie = relationship("Movie", back_populates="votes")
 
 
+class RoomMatch(Base):
+    """A movie liked by every participant of a room, recorded when the deciding vote lands."""
+
+    __tablename__ = "room_matches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
+    movie_id = Column(Integer, ForeignKey("movies.id"), nullable=False)
+    matched_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (UniqueConstraint("room_id", "movie_id"),)
+
+    room = relationship("Room", back_populates="matches")
+    movie = relationship("Movie")
+
+
+class RoomDeckCard(Base):
+    """A movie's place in the room's swipe order, shared by all its participants."""
+
+    __tablename__ = "room_deck"
+
+    id = Column(Integer, primary_key=True, index=True)
+    room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
+    position = Column(Integer, nullable=False)
+    movie_id = Column(Integer, ForeignKey("movies.id"), nullable=False)
+
+    __table_args__ = (
+        # Next cards are a range read on this index
+        UniqueConstraint("room_id", "position", name="uq_room_deck_room_position"),
+        UniqueConstraint("room_id", "movie_id", name="uq_room_deck_room_movie"),
+    )
+
+    movie = relationship("Movie")
+
+
 class Movie(Base):
     __tablename__ = "movies"
 
@@ -77,6 +139,8 @@ class Movie(Base):
     description = Column(String(1000))
     rating = Column(Integer)  # TMDB vote_average * 10 (stored as integer for precision)
     trailer_key = Column(String(50))  # YouTube trailer key
+    # Set once genre names, trailer and backdrop came from TMDB details; None for discover data
+    hydrated_at = Column(DateTime(timezone=True), nullable=True)
 
     votes = relationship("Vote", back_populates="movie")
     availabilities = relationship(
@@ -96,4 +160,30 @@ class MovieAvailability(Base):
 
     movie = relationship("Movie", back_populates="availabilities")
 
-    __table_args__ = (UniqueConstraint("movie_id", "region", "provider_id"),)
+    __table_args__ = (
+        UniqueConstraint("movie_id", "region", "provider_id"),
+        # Room pools: the movies available on these providers in this region, in id order
+        Index("ix_movie_availabilities_region_provider_id", "region", "provider_id", "movie_id"),
+    )
+
+
+class StaticCatalogSeed(Base):
+    """Marks that the static catalog is available on a provider in a region."""
+
+    __tablename__ = "static_catalog_seeds"
+
+    region = Column(String(2), primary_key=True)
+    provider_id = Column(Integer, primary_key=True)
+    seeded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class DiscoverCursor(Base):
+    """How far TMDB discover results were ingested for a region and set of providers."""
+
+    __tablename__ = "discover_cursors"
+
+    region = Column(String(2), primary_key=True)
+    provider_key = Column(String(200), primary_key=True)  # Sorted provider ids, e.g. "8,337"
+    last_page = Column(Integer, nullable=False, default=0, server_default="0")
+    total_pages = Column(Integer, nullable=True)  # As last reported by TMDB; None before page 1
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,68 +1,68 @@
 import json
-from pathlib import Path
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import Engine, case, func
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..models import Movie, MovieAvailability, Room, Vote
+from ..database import dialect_insert, get_db
+from ..models import DiscoverCursor, Movie, MovieAvailability, Participant, Room, Vote
 from ..schemas import MovieResponse
-from ..services.tmdb import (
-    TMDB_API_KEY,
-    discover_movies,
-    get_image_url,
-    get_movie_details,
-    get_trailer_key,
+from ..services.deck import (
+    decode_cursor,
+    encode_cursor,
+    extend_room_deck,
+    room_movies_page,
+    unvoted_movies,
 )
+from ..services.events import broker
+from ..services.hydration import hydrate_movies, hydrator
+from ..services.room_version import bump_room_version, not_modified, room_etag, set_etag
+from ..services.static_catalog import seed_static_catalog
+from ..services.tmdb import TMDB_API_KEY, discover_movies, genre_catalog, get_image_url
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # Minimum number of movies to keep in a room's pool
 MIN_MOVIES_IN_POOL = 50
 
-# Load static movie list from JSON for fallback when TMDB is not available
-_DATA_DIR = Path(__file__).parent.parent / "data"
-_MOVIES_FILE = _DATA_DIR / "movies.json"
+# How long a request waits for a TMDB pool top-up before answering with the movies it has
+POOL_FILL_DEADLINE_SECONDS = float(os.getenv("POOL_FILL_DEADLINE_MS", "800")) / 1000
 
-with open(_MOVIES_FILE) as f:
-    STATIC_MOVIES: list[dict] = json.load(f)
+# Top-ups running at once per process, each for one room
+POOL_FILL_WORKERS = 4
 
+# TMDB serves no discover page past this one, whatever total_pages says
+TMDB_MAX_DISCOVER_PAGE = 500
 
-def _seed_static_movies(
-    db: Session, region: str = "US", provider_ids: list[int] | None = None
-) -> None:
-    """Seed the database with static movies if empty (fallback when no TMDB)."""
-    provider_ids = provider_ids or [8]
-    if db.query(Movie).count() == 0:
-        # First time - create all movies
-        for movie_data in STATIC_MOVIES:
-            movie = Movie(**movie_data)
-            db.add(movie)
-            db.commit()
-            db.refresh(movie)
-            # Record availability for the room's region/providers
-            for provider_id in provider_ids:
-                _record_movie_availability(db, movie, region, provider_id)
-    else:
-        # Movies already exist - ensure availability is recorded for this region/providers
-        for movie in db.query(Movie).all():
-            for provider_id in provider_ids:
-                _record_movie_availability(db, movie, region, provider_id)
-
-
-def _tmdb_to_movie(db: Session, tmdb_movie: dict) -> Movie:
-    """Convert TMDB movie data to our Movie model, saving to DB if new."""
-    tmdb_id = tmdb_movie.get("id")
-    if tmdb_id is None:
-        raise ValueError("TMDB movie missing 'id' field")
-    tmdb_id = int(tmdb_id)  # Ensure it's an int
-
-    # Check if we already have this movie
-    movie = db.query(Movie).filter(Movie.tmdb_id == tmdb_id).first()
-    if movie:
-        return movie
+# Most availability rows written by one INSERT statement
+AVAILABILITY_BATCH_ROWS = 1000
+
+# Largest page of unvoted movies, and how many rows are read from the database at a time
+MAX_UNVOTED_PAGE = 500
+STREAM_BATCH_SIZE = 100
+
+# Running top-ups by room id
+_pool_fill_executor = ThreadPoolExecutor(max_workers=POOL_FILL_WORKERS, thread_name_prefix="pool")
+_pool_fills: dict[int, Future] = {}
+_pool_fills_lock = threading.Lock()
+
+
+def _tmdb_movie_row(tmdb_movie: dict, genre_names: dict[int, str]) -> dict:
+    """Convert a TMDB discover result to the column values of a new, unhydrated Movie.
+
+    Genre ids are named from the TMDB genre catalog. Trailer and backdrop come
+    later from the movie's details; see ``services.hydration``.
+    """
+    tmdb_id = int(tmdb_movie["id"])
 
     # Extract year from release_date
     year = None
@@ -73,82 +73,107 @@ def _tmdb_to_movie(db: Session, tmdb_movie: dict) -> Movie:
         except (ValueError, IndexError):
             pass
 
-    # Build genre string from genre_ids (we'll fetch full details for names)
+    # Build genre string from genre_ids; ids missing from the catalog wait for the details
     genre_ids = tmdb_movie.get("genre_ids", [])
-    genre = ", ".join(str(g) for g in genre_ids[:3])  # Placeholder, will enhance later
-
-    # Get full details for better data
-    try:
-        details = get_movie_details(db, tmdb_id)
-
-        # Get proper genre names
-        genres = details.get("genres", [])
-        genre = ", ".join(g["name"] for g in genres[:3])
-
-        # Get trailer key
-        videos = details.get("videos", {})
-        trailer_key = get_trailer_key(videos)
-
-        # Get backdrop
-        backdrop_path = details.get("backdrop_path")
-        backdrop_url = get_image_url(backdrop_path, "w780") if backdrop_path else None
-
-        # Get rating
-        rating = int(details.get("vote_average", 0) * 10)  # Store as integer (e.g., 87 for 8.7)
-
-    except Exception:
-        # Fallback to basic data if details fetch fails
-        details = tmdb_movie
-        backdrop_url = None
-        trailer_key = None
-        rating = int(tmdb_movie.get("vote_average", 0) * 10)
+    genre = ", ".join(genre_names[g] for g in genre_ids[:3] if g in genre_names)
 
     # Build poster URL
     poster_path = tmdb_movie.get("poster_path")
     poster_url = get_image_url(poster_path, "w342") if poster_path else None
 
-    # Create and save movie
-    movie = Movie(
-        tmdb_id=tmdb_id,
-        title=tmdb_movie.get("title", "Unknown"),
-        year=year,
-        genre=genre,
-        poster_url=poster_url,
-        backdrop_url=backdrop_url,
-        description=tmdb_movie.get("overview", ""),
-        rating=rating,
-        trailer_key=trailer_key,
-    )
-    db.add(movie)
-    db.commit()
-    db.refresh(movie)
+    return {
+        "tmdb_id": tmdb_id,
+        "title": tmdb_movie.get("title", "Unknown"),
+        "year": year,
+        "genre": genre,
+        "poster_url": poster_url,
+        "description": tmdb_movie.get("overview", ""),
+        "rating": int(tmdb_movie.get("vote_average", 0) * 10),
+    }
+
+
+def _ingest_discover_page(db: Session, results: list[dict]) -> tuple[list[int], int]:
+    """Store the movies of a TMDB discover page that are not stored yet.
+
+    Known movies are resolved with one ``IN`` query and the missing ones are
+    written with one ``INSERT ... ON CONFLICT (tmdb_id) DO NOTHING``, so a room
+    filling the same region concurrently never fails on the unique index. The
+    whole page is stored: the discover cursor does not come back to it.
+    Returns the page's movie ids, in page order, and how many were inserted.
+    """
+    tmdb_ids = list(dict.fromkeys(int(m["id"]) for m in results if m.get("id") is not None))
+    if not tmdb_ids:
+        return [], 0
+    known = dict(db.query(Movie.tmdb_id, Movie.id).filter(Movie.tmdb_id.in_(tmdb_ids)).all())
+
+    by_tmdb_id = {int(m["id"]): m for m in results if m.get("id") is not None}
+    missing = [tmdb_id for tmdb_id in tmdb_ids if tmdb_id not in known]
+    inserted = 0
+    if missing:
+        try:
+            genre_names = genre_catalog.names(db)
+        except Exception:
+            # Hydration fills in the genres from the movie details
+            db.rollback()
+            genre_names = {}
+        rows = [_tmdb_movie_row(by_tmdb_id[tmdb_id], genre_names) for tmdb_id in missing]
+        statement = (
+            dialect_insert(db)(Movie)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Movie.tmdb_id])
+            .returning(Movie.tmdb_id, Movie.id)
+        )
+        created = dict(db.execute(statement).all())
+        inserted = len(created)
+        known.update(created)
+
+        # Movies another request inserted in between are skipped, not returned
+        raced = [tmdb_id for tmdb_id in missing if tmdb_id not in created]
+        if raced:
+            known.update(db.query(Movie.tmdb_id, Movie.id).filter(Movie.tmdb_id.in_(raced)).all())
+        db.commit()
+        if inserted:
+            hydrator.schedule()
 
-    return movie
+    return [known[tmdb_id] for tmdb_id in tmdb_ids if tmdb_id in known], inserted
 
 
-def _record_movie_availability(db: Session, movie: Movie, region: str, provider_id: int) -> None:
-    """Record that a movie is available for a specific region/provider."""
-    existing = (
-        db.query(MovieAvailability)
-        .filter(
-            MovieAvailability.movie_id == movie.id,
-            MovieAvailability.region == region,
-            MovieAvailability.provider_id == provider_id,
-        )
-        .first()
-    )
-    if not existing:
-        availability = MovieAvailability(
-            movie_id=movie.id,
-            region=region,
-            provider_id=provider_id,
+def _record_availabilities(
+    db: Session, movie_ids: list[int], region: str, provider_ids: list[int]
+) -> None:
+    """Record that movies are available on providers in a region, in one statement.
+
+    Pairs already recorded are left alone through the table's unique constraint.
+    Everything is written in a single transaction.
+    """
+    rows = [
+        {"movie_id": movie_id, "region": region, "provider_id": provider_id}
+        for movie_id in dict.fromkeys(movie_ids)
+        for provider_id in provider_ids
+    ]
+    insert = dialect_insert(db)
+    # A TMDB page is one statement; larger batches stay under bind parameter limits
+    for start in range(0, len(rows), AVAILABILITY_BATCH_ROWS):
+        statement = (
+            insert(MovieAvailability)
+            .values(rows[start : start + AVAILABILITY_BATCH_ROWS])
+            .on_conflict_do_nothing(
+                index_elements=[
+                    MovieAvailability.movie_id,
+                    MovieAvailability.region,
+                    MovieAvailability.provider_id,
+                ]
+            )
         )
-        db.add(availability)
-        db.commit()
+        db.execute(statement)
+    db.commit()
+
 
+def _ensure_movies_in_pool(db: Session, room: Room, count: int = MIN_MOVIES_IN_POOL) -> bool:
+    """Ensure room has enough movies in its pool by fetching from TMDB or using static fallback.
 
-def _ensure_movies_in_pool(db: Session, room: Room, count: int = MIN_MOVIES_IN_POOL) -> None:
-    """Ensure room has enough movies in its pool by fetching from TMDB or using static fallback."""
+    Returns True if the pool is still being filled in the background.
+    """
     # Get room's region/provider preferences
     region: str = str(room.region)
     provider_ids: list[int] = room.provider_ids if room.provider_ids else [8]  # type: ignore
@@ -171,44 +196,144 @@ def _ensure_movies_in_pool(db: Session, room: Room, count: int = MIN_MOVIES_IN_P
     )
 
     if existing_count >= count:
-        return
+        return False
 
     # If TMDB API key is not available, use static movies as fallback
     if not TMDB_API_KEY:
-        _seed_static_movies(db, region, provider_ids)
+        if seed_static_catalog(db, region, provider_ids):
+            extend_room_deck(db, room)
+            bump_room_version(db, room.id)  # type: ignore[arg-type]
+            db.commit()
+        return False
+
+    return _top_up_within_deadline(db, room, count - existing_count)
+
+
+def _top_up_within_deadline(db: Session, room: Room, needed: int) -> bool:
+    """Top up the room's pool from TMDB on a pool-fill thread, waiting until the deadline.
+
+    A room has at most one top-up running; later requests wait on it. Returns
+    True when POOL_FILL_DEADLINE_SECONDS passed first: the top-up goes on in
+    the background, and bumps the room's version once it is done.
+    """
+    room_id: int = room.id  # type: ignore[assignment]
+    with _pool_fills_lock:
+        fill = _pool_fills.get(room_id)
+        # A finished top-up may not have been forgotten yet; it cannot fill the pool again
+        if fill is None or fill.done():
+            fill = _pool_fill_executor.submit(_top_up_room, db.get_bind(), room_id, needed)
+            _pool_fills[room_id] = fill
+    fill.add_done_callback(lambda done: _forget_pool_fill(room_id, done))
+
+    try:
+        fill.result(timeout=POOL_FILL_DEADLINE_SECONDS)
+    except TimeoutError:
+        return True
+    except Exception as e:
+        logger.warning(f"Error topping up the pool of room {room_id}: {e}")
+    finally:
+        # The top-up committed in its own session
+        db.expire(room)
+    return False
+
+
+def _forget_pool_fill(room_id: int, fill: Future) -> None:
+    with _pool_fills_lock:
+        if _pool_fills.get(room_id) is fill:
+            del _pool_fills[room_id]
+
+
+def _top_up_room(bind: Engine, room_id: int, needed: int) -> None:
+    """Fetch ``needed`` more movies for a room's pool, in a session of its own."""
+    with Session(bind=bind) as db:
+        room = db.get(Room, room_id)
+        if room is not None:
+            _top_up_from_tmdb(db, room, needed)
+
+
+def _top_up_from_tmdb(db: Session, room: Room, needed: int) -> None:
+    """Ingest discover pages for the room's region and providers until ``needed`` are new."""
+    region: str = str(room.region)
+    provider_ids: list[int] = room.provider_ids if room.provider_ids else [8]  # type: ignore
+
+    # Resume discovery where the previous top-up for these providers stopped
+    provider_ids = sorted(set(provider_ids))
+    provider_key = ",".join(str(p) for p in provider_ids)
+    cursor = (
+        db.query(DiscoverCursor.last_page, DiscoverCursor.total_pages)
+        .filter(DiscoverCursor.region == region, DiscoverCursor.provider_key == provider_key)
+        .first()
+    )
+    last_page, total_pages = cursor if cursor else (0, None)
+    if total_pages is not None and last_page >= min(total_pages, TMDB_MAX_DISCOVER_PAGE):
+        # Every movie TMDB lists for these providers is in the pool already
         return
 
     # Need to fetch more movies
-    needed = count - existing_count
     pages_needed = (needed // 20) + 1  # TMDB returns 20 per page
 
     fetched_count = 0
-    for page in range(1, pages_needed + 1):
+    ingested_pages = 0
+    for page in range(last_page + 1, last_page + pages_needed + 1):
+        if total_pages is not None and page > min(total_pages, TMDB_MAX_DISCOVER_PAGE):
+            break
         try:
             tmdb_data = discover_movies(db, region=region, provider_ids=provider_ids, page=page)
             results = tmdb_data.get("results", [])
+            total_pages = int(tmdb_data.get("total_pages", page))
+
+            page_movie_ids, inserted = _ingest_discover_page(db, results)
+            fetched_count += inserted
 
-            for tmdb_movie in results:
-                # Check if movie already exists
-                existing = db.query(Movie).filter(Movie.tmdb_id == tmdb_movie["id"]).first()
-                if existing:
-                    # Record availability for each provider
-                    for provider_id in provider_ids:
-                        _record_movie_availability(db, existing, region, provider_id)
-                else:
-                    # Create new movie and record availability for each provider
-                    movie = _tmdb_to_movie(db, tmdb_movie)
-                    for provider_id in provider_ids:
-                        _record_movie_availability(db, movie, region, provider_id)
-                    fetched_count += 1
-
-                if fetched_count >= needed:
-                    break
+            # Record availability for each provider, for the whole page at once
+            _record_availabilities(db, page_movie_ids, region, provider_ids)
+            _advance_discover_cursor(db, region, provider_key, page, total_pages)
+            ingested_pages += 1
+
+            if fetched_count >= needed:
+                break
 
         except Exception as e:
-            # Log error but continue - we might have partial results
+            # The cursor stays before this page, so the next top-up retries it
             print(f"Error fetching from TMDB page {page}: {e}")
-            continue
+            db.rollback()
+            break
+
+    if not ingested_pages:
+        # Nothing changed, but readers told the pool was filling must not get a 304 for it
+        bump_room_version(db, room.id)  # type: ignore[arg-type]
+        db.commit()
+        return
+
+    extend_room_deck(db, room)
+    # The pool changed after the writes above committed; readers of the old version refetch
+    bump_room_version(db, room.id)  # type: ignore[arg-type]
+    db.commit()
+    # Clients that were told the pool is filling fetch the new movies
+    broker.publish(room.id, {"type": "pool_updated"})  # type: ignore[arg-type]
+
+
+def _advance_discover_cursor(
+    db: Session, region: str, provider_key: str, page: int, total_pages: int
+) -> None:
+    """Record that discover ``page`` was ingested; the cursor never moves back."""
+    insert = dialect_insert(db)
+    statement = insert(DiscoverCursor).values(
+        region=region, provider_key=provider_key, last_page=page, total_pages=total_pages
+    )
+    ingested = statement.excluded.last_page
+    statement = statement.on_conflict_do_update(
+        index_elements=[DiscoverCursor.region, DiscoverCursor.provider_key],
+        set_={
+            "last_page": case(
+                (ingested > DiscoverCursor.last_page, ingested), else_=DiscoverCursor.last_page
+            ),
+            "total_pages": statement.excluded.total_pages,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(statement)
+    db.commit()
 
 
 class RoomInfo(BaseModel):
@@ -220,12 +345,16 @@ class RoomInfo(BaseModel):
 class MoviesWithRoomResponse(BaseModel):
     movies: List[MovieResponse]
     room: RoomInfo
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last
+    pool_filling: bool = False  # More movies are being fetched; ask again shortly for them
 
 
 @router.get("", response_model=MoviesWithRoomResponse)
 def get_movies(
     code: str,
-    page: int = Query(1, ge=1),
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     limit: int = Query(50, ge=1, le=100),
     refresh: bool = Query(False, description="Force fetch new movies from TMDB"),
     db: Session = Depends(get_db),
@@ -235,13 +364,24 @@ def get_movies(
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
 
+    try:
+        after_id = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Nothing in the room changed since the client's copy: skip the pool and deck queries
+    etag_variant = ("movies", cursor or "", limit)
+    if not refresh and (cached := not_modified(request, room_etag(room, *etag_variant))):
+        return cached
+
     # Get room's region/providers for filtering
     region: str = str(room.region)
     provider_ids: list[int] = room.provider_ids if room.provider_ids else [8]  # type: ignore
 
     # If refresh requested, fetch additional movies beyond current pool
+    pool_filling = False
     if refresh:
-        # Count existing unvoted movies available for this room to determine which page to fetch
+        # Count existing unvoted movies available for this room, to ask for a batch more
         voted_movie_ids = db.query(Vote.movie_id).filter(Vote.room_id == room.id).subquery()
         available_movie_ids = (
             db.query(MovieAvailability.movie_id)
@@ -257,32 +397,24 @@ def get_movies(
             .filter(~Movie.id.in_(voted_movie_ids))
             .count()
         )
-        # Fetch additional movies (next batch)
-        _ensure_movies_in_pool(db, room, count=existing_count + MIN_MOVIES_IN_POOL)
+        # Fetch additional movies (next batch, from the discover cursor)
+        pool_filling = _ensure_movies_in_pool(db, room, count=existing_count + MIN_MOVIES_IN_POOL)
 
-    # Ensure we have movies in the pool
-    _ensure_movies_in_pool(db, room)
+    # Ensure we have movies in the pool, unless a refresh is still filling it
+    if not pool_filling:
+        pool_filling = _ensure_movies_in_pool(db, room)
 
-    # Get movies available for this room's region/providers that haven't been voted on yet
-    voted_movie_ids = db.query(Vote.movie_id).filter(Vote.room_id == room.id).subquery()
-    available_movie_ids = (
-        db.query(MovieAvailability.movie_id)
-        .filter(
-            MovieAvailability.region == region,
-            MovieAvailability.provider_id.in_(provider_ids),
-        )
-        .subquery()
-    )
+    # The room's deck, in the order the swipe endpoint deals it, without voted movies
+    try:
+        movies, last_id = room_movies_page(db, room, limit, after_id)
+    except ValueError:
+        # A well-formed cursor from another room, or from before the deck order
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    movies = (
-        db.query(Movie)
-        .filter(Movie.id.in_(available_movie_ids))
-        .filter(~Movie.id.in_(voted_movie_ids))
-        .order_by(Movie.id.desc())
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
-    )
+    # Top-ups above expire the room, so this reads the version they bumped. A pool
+    # still filling is not cached: the page must ask again even if the top-up fails
+    if not pool_filling:
+        set_etag(response, room_etag(room, *etag_variant))
 
     return MoviesWithRoomResponse(
         movies=[MovieResponse.model_validate(m) for m in movies],
@@ -291,47 +423,88 @@ def get_movies(
             region=str(room.region),
             provider_ids=provider_ids,
         ),
+        next_cursor=encode_cursor(last_id) if last_id is not None else None,
+        pool_filling=pool_filling,
     )
 
 
-@router.get("/unvoted", response_model=List[MovieResponse])
+class UnvotedMoviesResponse(BaseModel):
+    movies: List[MovieResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last
+    pool_filling: bool = False  # More movies are being fetched; ask again shortly for them
+
+
+@router.get("/unvoted", response_model=UnvotedMoviesResponse)
 def get_unvoted_movies(
     code: str,
     participant_id: int,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=MAX_UNVOTED_PAGE),
     db: Session = Depends(get_db),
 ):
-    """Get movies a specific participant hasn't voted on."""
+    """Get movies a participant of the room hasn't voted on, newest first, one page at a time.
+
+    The page is streamed as it is read from the database.
+    """
     room = db.query(Room).filter(Room.code == code).first()
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    # Ensure we have movies
-    _ensure_movies_in_pool(db, room)
+    participant = (
+        db.query(Participant.id)
+        .filter(Participant.id == participant_id, Participant.room_id == room.id)
+        .first()
+    )
+    if not participant:
+        raise HTTPException(status_code=404, detail="Participant not found in this room")
 
-    # Get room's region/providers for filtering
-    region: str = str(room.region)
-    provider_ids: list[int] = room.provider_ids if room.provider_ids else [8]  # type: ignore
+    try:
+        before_id = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    # Get movies this participant hasn't voted on yet, filtered by availability
-    voted_movie_ids = [
-        vote.movie_id for vote in db.query(Vote).filter(Vote.participant_id == participant_id).all()
-    ]
-    available_movie_ids = (
-        db.query(MovieAvailability.movie_id)
-        .filter(
-            MovieAvailability.region == region,
-            MovieAvailability.provider_id.in_(provider_ids),
-        )
-        .subquery()
-    )
+    # Ensure we have movies
+    pool_filling = _ensure_movies_in_pool(db, room)
 
-    movies = (
-        db.query(Movie)
-        .filter(Movie.id.in_(available_movie_ids))
-        .filter(~Movie.id.in_(voted_movie_ids))
-        .all()
+    # The request's session is closed before the body is sent; stream from our own
+    room_id: int = room.id  # type: ignore[assignment]
+    return StreamingResponse(
+        _stream_unvoted_movies(
+            db.get_bind(), room_id, participant_id, limit, before_id, pool_filling
+        ),
+        media_type="application/json",
     )
-    return movies
+
+
+def _stream_unvoted_movies(
+    bind: Engine,
+    room_id: int,
+    participant_id: int,
+    limit: int,
+    before_id: int | None,
+    pool_filling: bool,
+) -> Iterator[str]:
+    """Yield the JSON of an UnvotedMoviesResponse, one movie at a time."""
+    db = Session(bind=bind)
+    try:
+        room = db.query(Room).filter(Room.id == room_id).one()
+        movies = unvoted_movies(db, room, participant_id, before_id).limit(limit + 1)
+
+        yield '{"movies":['
+        sent: list[int] = []
+        next_cursor = None
+        for movie in movies.yield_per(STREAM_BATCH_SIZE):
+            if len(sent) == limit:
+                # There is a movie past this page: continue after the last one sent
+                next_cursor = encode_cursor(sent[-1])
+                break
+            yield ("," if sent else "") + MovieResponse.model_validate(movie).model_dump_json()
+            sent.append(movie.id)  # type: ignore[arg-type]
+        yield (
+            f'],"next_cursor":{json.dumps(next_cursor)},"pool_filling":{json.dumps(pool_filling)}}}'
+        )
+    finally:
+        db.close()
 
 
 @router.get("/{movie_id}", response_model=MovieResponse)
@@ -341,22 +514,12 @@ def get_movie_detail(movie_id: int, db: Session = Depends(get_db)):
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
 
-    # Refresh from TMDB if we have a tmdb_id
-    if movie.tmdb_id:
+    # Movies stored from discover results get their details on first view
+    if movie.tmdb_id and movie.hydrated_at is None:
         try:
-            details = get_movie_details(db, int(movie.tmdb_id))  # type: ignore[arg-type]
-
-            # Update fields if needed
-            if not movie.trailer_key:
-                videos = details.get("videos", {})
-                movie.trailer_key = get_trailer_key(videos)
-
-            if not movie.backdrop_url and details.get("backdrop_path"):
-                movie.backdrop_url = get_image_url(details["backdrop_path"], "w780")
-
-            db.commit()
+            hydrate_movies(db, [movie])
         except Exception:
-            # Ignore errors, return cached data
-            pass
+            # Ignore errors, return the discover data
+            db.rollback()
 
     return movie
@@ -0,0 +1,141 @@
+"""WebSocket room channel: live joins, partner progress, matches and votes."""
+
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from sqlalchemy import func
+from starlette.concurrency import run_in_threadpool
+
+from ..database import SessionLocal
+from ..models import Participant, Room, Vote
+from ..schemas import VoteCreate
+from ..services.events import RoomSubscription, broker
+from ..services.matches import load_matches_since
+from ..services.voting import record_vote
+
+router = APIRouter()
+
+
+def _authenticate(code: str, session_id: str) -> tuple[int, int] | None:
+    """Resolve (room_id, participant_id) for a session cookie, or None."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(Room.id, Participant.id)
+            .join(Participant, Participant.room_id == Room.id)
+            .filter(Room.code == code, Participant.session_id == session_id)
+            .first()
+        )
+        return (row[0], row[1]) if row else None
+    finally:
+        db.close()
+
+
+def _room_state(room_id: int) -> dict[str, Any]:
+    """Snapshot of participants and how many movies each has voted on."""
+    db = SessionLocal()
+    try:
+        participants = db.query(Participant).filter(Participant.room_id == room_id).all()
+        counts = dict(
+            db.query(Vote.participant_id, func.count(Vote.id))
+            .filter(Vote.room_id == room_id)
+            .group_by(Vote.participant_id)
+            .all()
+        )
+        return {
+            "type": "room_state",
+            "participants": [
+                {"id": p.id, "name": p.name, "vote_count": counts.get(p.id, 0)}
+                for p in participants
+            ],
+        }
+    finally:
+        db.close()
+
+
+def _match_event(room_id: int, match_id: int) -> dict[str, Any] | None:
+    db = SessionLocal()
+    try:
+        for loaded_id, match in load_matches_since(db, room_id, match_id - 1):
+            if loaded_id == match_id:
+                return {"type": "match", "id": match_id, **match.model_dump(mode="json")}
+        return None
+    finally:
+        db.close()
+
+
+def _vote(room_id: int, participant_id: int, vote: VoteCreate) -> dict[str, Any]:
+    db = SessionLocal()
+    try:
+        result = record_vote(db, room_id, participant_id, vote)
+        return {"type": "vote_result", **result.model_dump()}
+    finally:
+        db.close()
+
+
+async def _forward_events(websocket: WebSocket, subscription: RoomSubscription) -> None:
+    """Relay broker events for the room to this socket."""
+    while True:
+        event = await subscription.get()
+        if event is None:
+            continue
+        if event["type"] == "match":
+            event = await run_in_threadpool(_match_event, subscription.room_id, event["id"])
+            if event is None:
+                continue
+        await websocket.send_json(event)
+
+
+async def _receive_votes(websocket: WebSocket, room_id: int, participant_id: int) -> None:
+    """Handle vote frames sent by the client."""
+    while True:
+        message = await websocket.receive_json()
+        if message.get("type") != "vote":
+            await websocket.send_json({"type": "error", "detail": "Unknown message type"})
+            continue
+        try:
+            vote = VoteCreate.model_validate(message)
+        except ValidationError as e:
+            await websocket.send_json({"type": "error", "detail": e.errors(include_url=False)})
+            continue
+        await websocket.send_json(await run_in_threadpool(_vote, room_id, participant_id, vote))
+
+
+@router.websocket("/ws/rooms/{code}")
+async def room_channel(websocket: WebSocket, code: str):
+    """Bidirectional room channel authenticated by the ``session_id`` cookie.
+
+    Server frames: ``room_state`` on connect, then ``participant_joined``,
+    ``votes`` (a participant's vote count), ``match``, ``unmatch``, ``pool_updated``
+    and ``vote_result``.
+    Client frames: ``{"type": "vote", "movie_id": ..., "liked": ...}``.
+    """
+    session_id = websocket.cookies.get("session_id", "")
+    identity = await run_in_threadpool(_authenticate, code, session_id)
+    if identity is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    room_id, participant_id = identity
+
+    await websocket.accept()
+    subscription = broker.subscribe(room_id)
+    tasks: list[asyncio.Task] = []
+    try:
+        await websocket.send_json(await run_in_threadpool(_room_state, room_id))
+        tasks = [
+            asyncio.create_task(_forward_events(websocket, subscription)),
+            asyncio.create_task(_receive_votes(websocket, room_id, participant_id)),
+        ]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            # Surface errors other than the client going away
+            if not isinstance(task.exception(), WebSocketDisconnect):
+                task.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        broker.unsubscribe(subscription)
@@ -1,12 +1,27 @@
 import uuid
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import Participant, Room
-from ..schemas import ParticipantCreate, ParticipantResponse, RoomCreate, RoomResponse
+from ..schemas import (
+    MovieResponse,
+    ParticipantCreate,
+    ParticipantResponse,
+    RoomCreate,
+    RoomResponse,
+    SwipeResponse,
+    VoteCreate,
+)
+from ..services.deck import advance_deck_cursor, extend_room_deck, next_deck_cards
+from ..services.events import broker
+from ..services.matches import describe_matches
+from ..services.room_version import bump_room_version, not_modified, room_etag, set_etag
+from ..services.session_tokens import issue_token, resolve_voter, rotate_room_key
+from ..services.voting import record_vote
 
 router = APIRouter()
 
@@ -28,19 +43,26 @@ def create_room(room_data: RoomCreate | None = None, db: Session = Depends(get_d
         db.add(room)
         try:
             db.commit()
-            db.refresh(room)
-            return room
         except IntegrityError:
             db.rollback()
             continue
+        # Deal from the movies already known for the room's region/providers
+        extend_room_deck(db, room)
+        db.refresh(room)
+        return room
     raise HTTPException(status_code=500, detail="Could not generate unique room code")
 
 
 @router.get("/{code}", response_model=RoomResponse)
-def get_room(code: str, db: Session = Depends(get_db)):
+def get_room(code: str, request: Request, response: Response, db: Session = Depends(get_db)):
     room = db.query(Room).filter(Room.code == code).first()
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
+
+    etag = room_etag(room, "room")
+    if cached := not_modified(request, etag):
+        return cached
+    set_etag(response, etag)
     return room
 
 
@@ -67,7 +89,7 @@ def join_room(
 
     if existing:
         response.set_cookie(key="session_id", value=session_id, httponly=True)
-        return existing
+        return _with_token(room, existing)
 
     # Check room capacity (max 2 for now)
     participant_count = db.query(Participant).filter(Participant.room_id == room.id).count()
@@ -77,7 +99,83 @@ def join_room(
 
     new_participant = Participant(room_id=room.id, name=participant.name, session_id=session_id)
     db.add(new_participant)
+    bump_room_version(db, room.id)  # type: ignore[arg-type]
     db.commit()
     db.refresh(new_participant)
+    broker.publish(
+        room.id,  # type: ignore[arg-type]
+        {
+            "type": "participant_joined",
+            "participant": {"id": new_participant.id, "name": new_participant.name},
+        },
+    )
     response.set_cookie(key="session_id", value=session_id, httponly=True)
-    return new_participant
+    return _with_token(room, new_participant)
+
+
+@router.post("/{code}/token-key/rotate", response_model=ParticipantResponse)
+def rotate_token_key(code: str, request: Request, db: Session = Depends(get_db)):
+    """Revoke every participant token of the room and issue a new one to the caller.
+
+    Authenticated by the session cookie only, since tokens may be compromised.
+    Other participants keep voting through their cookie until they rejoin.
+    """
+    room = db.query(Room).filter(Room.code == code).first()
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    participant = (
+        db.query(Participant)
+        .filter(Participant.room_id == room.id, Participant.session_id == get_session_id(request))
+        .first()
+    )
+    if not participant:
+        raise HTTPException(status_code=403, detail="Not a participant in this room")
+
+    rotate_room_key(db, room)
+    return _with_token(room, participant)
+
+
+@router.post("/{code}/swipe", response_model=SwipeResponse)
+def swipe(
+    code: str,
+    vote: VoteCreate,
+    request: Request,
+    limit: int = Query(
+        10, ge=0, le=50, description="How many unvoted movies to return; 0 when the deck is full"
+    ),
+    after: Optional[int] = Query(None, description="Id of the last movie in the client's deck"),
+    db: Session = Depends(get_db),
+):
+    """Record a vote and return the match it completed plus the next cards of the deck.
+
+    Accepts the same participant token or session cookie as the vote endpoints.
+    Swiping moves the participant's deck cursor to the voted card; the next
+    cards are dealt from the room's deck in its shared order. The deck is
+    never topped up from TMDB here, so a swipe stays a handful of queries.
+    """
+    voter = resolve_voter(db, code, request)
+    result = record_vote(db, voter.room_id, voter.participant_id, vote)
+
+    completed = [result.movie_id] if result.completed_match else []
+    matches = describe_matches(db, voter.room_id, completed)
+
+    position = advance_deck_cursor(db, voter.participant_id, vote.movie_id)
+    movies = []
+    if limit:
+        room = db.query(Room).filter(Room.id == voter.room_id).one()
+        movies = next_deck_cards(
+            db, room, voter.participant_id, position, limit, after_movie_id=after
+        )
+
+    return SwipeResponse(
+        vote=result,
+        match=matches[0] if matches else None,
+        next_movies=[MovieResponse.model_validate(m) for m in movies],
+    )
+
+
+def _with_token(room: Room, participant: Participant) -> ParticipantResponse:
+    result = ParticipantResponse.model_validate(participant)
+    result.token = issue_token(room, participant.id)  # type: ignore[arg-type]
+    return result
@@ -1,95 +1,149 @@
-from typing import List
+import json
+from typing import AsyncIterator, List
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from ..database import get_db
-from ..models import Movie, Participant, Room, Vote
-from ..schemas import MatchResponse, VoteCreate, VoteResponse
+from ..database import SessionLocal, get_db
+from ..models import Movie, Participant, Room, RoomMatch
+from ..schemas import MatchResponse, VoteBatchResponse, VoteCreate, VoteResponse
+from ..services.events import broker
+from ..services.matches import describe_matches, load_matches_since
+from ..services.room_version import not_modified, room_etag, set_etag
+from ..services.session_tokens import resolve_voter
+from ..services.voting import record_vote, record_votes
 
 router = APIRouter()
 
+# Most votes accepted in one batch request
+MAX_VOTE_BATCH = 100
 
-def get_session_id(request: Request) -> str:
-    return request.cookies.get("session_id", "")
+# Idle streams get a comment line this often so proxies and the ALB keep them open
+STREAM_KEEPALIVE_SECONDS = 15.0
 
 
 @router.post("", response_model=VoteResponse)
 def create_vote(code: str, vote: VoteCreate, request: Request, db: Session = Depends(get_db)):
-    room = db.query(Room).filter(Room.code == code).first()
-    if not room:
-        raise HTTPException(status_code=404, detail="Room not found")
+    voter = resolve_voter(db, code, request)
+    return record_vote(db, voter.room_id, voter.participant_id, vote)
 
-    session_id = get_session_id(request)
-    participant = (
-        db.query(Participant)
-        .filter(Participant.room_id == room.id, Participant.session_id == session_id)
-        .first()
-    )
 
-    if not participant:
-        raise HTTPException(status_code=403, detail="Not a participant in this room")
-
-    # Check if already voted on this movie
-    existing = (
-        db.query(Vote)
-        .filter(
-            Vote.room_id == room.id,
-            Vote.participant_id == participant.id,
-            Vote.movie_id == vote.movie_id,
-        )
-        .first()
-    )
+@router.post("/batch", response_model=VoteBatchResponse)
+def create_votes(
+    code: str, votes: List[VoteCreate], request: Request, db: Session = Depends(get_db)
+):
+    """Record several swipes at once, e.g. those queued while offline.
 
-    if existing:
-        # Update existing vote
-        existing.liked = vote.liked
-        db.commit()
-        db.refresh(existing)
-        return existing
+    Votes are written in one transaction; a movie voted on twice keeps its
+    last vote. Returns one result per distinct movie and the matches the batch completed.
+    """
+    if len(votes) > MAX_VOTE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_VOTE_BATCH} votes per batch")
+    voter = resolve_voter(db, code, request)
 
-    new_vote = Vote(
-        room_id=room.id, participant_id=participant.id, movie_id=vote.movie_id, liked=vote.liked
-    )
-    db.add(new_vote)
-    db.commit()
-    db.refresh(new_vote)
-    return new_vote
+    results = record_votes(db, voter.room_id, voter.participant_id, votes)
+
+    # Movies already matched before the batch, e.g. on a retried flush, are not new
+    matched_ids = [result.movie_id for result in results if result.completed_match]
+    matches = describe_matches(db, voter.room_id, matched_ids)
+    return VoteBatchResponse(votes=results, matches=matches)
 
 
 @router.get("/matches", response_model=List[MatchResponse])
-def get_matches(code: str, db: Session = Depends(get_db)):
+def get_matches(code: str, request: Request, response: Response, db: Session = Depends(get_db)):
     room = db.query(Room).filter(Room.code == code).first()
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    # Find movies where all participants liked
-    participants = db.query(Participant).filter(Participant.room_id == room.id).all()
-    participant_ids = [p.id for p in participants]
+    etag = room_etag(room, "matches")
+    if cached := not_modified(request, etag):
+        return cached
+    set_etag(response, etag)
 
-    if len(participant_ids) < 2:
+    participants = db.query(Participant).filter(Participant.room_id == room.id).all()
+    if len(participants) < 2:
         return []
 
-    # Get all movies voted liked by each participant
-    matches = []
-    movies = db.query(Movie).all()
-
-    for movie in movies:
-        votes = (
-            db.query(Vote)
-            .filter(Vote.room_id == room.id, Vote.movie_id == movie.id, Vote.liked.is_(True))
-            .all()
-        )
-
-        voter_ids = [v.participant_id for v in votes]
-
-        # Check if all participants liked this movie
-        if set(participant_ids).issubset(set(voter_ids)):
-            matches.append(
-                MatchResponse(
-                    movie=movie,
-                    participants=[p.name for p in participants],  # type: ignore
-                )
-            )
-
-    return matches
+    movies = (
+        db.query(Movie)
+        .join(RoomMatch, RoomMatch.movie_id == Movie.id)
+        .filter(RoomMatch.room_id == room.id)
+        .order_by(RoomMatch.matched_at, RoomMatch.id)
+        .all()
+    )
+
+    participant_names = [p.name for p in participants]
+    return [
+        MatchResponse(movie=movie, participants=participant_names)  # type: ignore
+        for movie in movies
+    ]
+
+
+def _matches_since(room_id: int, last_match_id: int) -> list[tuple[int, MatchResponse]]:
+    db = SessionLocal()
+    try:
+        return load_matches_since(db, room_id, last_match_id)
+    finally:
+        db.close()
+
+
+async def _match_events(request: Request, room_id: int, last_match_id: int) -> AsyncIterator[str]:
+    """Yield SSE frames for matches after ``last_match_id``, then for each new one.
+
+    A match undone by a changed vote is sent as an ``unmatch`` event, and new
+    movies in the room's deck as a ``pool_updated`` event.
+    """
+    # Subscribe before the replay so a match recorded in between is not lost
+    subscription = broker.subscribe(room_id)
+    try:
+        while True:
+            for match_id, match in await run_in_threadpool(_matches_since, room_id, last_match_id):
+                last_match_id = match_id
+                yield f"id: {match_id}\nevent: match\ndata: {match.model_dump_json()}\n\n"
+
+            while True:
+                if await request.is_disconnected():
+                    return
+                event = await subscription.get(timeout=STREAM_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield ": keepalive\n\n"
+                elif event["type"] == "match":
+                    break
+                elif event["type"] == "unmatch":
+                    # No id: a resumed stream only replays matches still recorded
+                    yield f"event: unmatch\ndata: {json.dumps({'movie_id': event['movie_id']})}\n\n"
+                elif event["type"] == "pool_updated":
+                    yield "event: pool_updated\ndata: {}\n\n"
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/matches/stream")
+def stream_matches(
+    code: str,
+    request: Request,
+    last_event_id: str | None = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Server-Sent Events stream of the room's matches.
+
+    Replays matches after ``Last-Event-ID`` (all of them on first connect), then
+    pushes each new match as it is recorded, and each match undone as ``unmatch``.
+    A ``pool_updated`` event tells that a pool top-up added movies to the room.
+    """
+    room = db.query(Room).filter(Room.code == code).first()
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    try:
+        last_match_id = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        last_match_id = 0
+
+    return StreamingResponse(
+        _match_events(request, int(room.id), last_match_id),  # type: ignore[arg-type]
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class RoomCreate(BaseModel):
@@ -38,6 +38,7 @@ class ParticipantResponse(BaseModel):
     id: int
     name: str
     session_id: str
+    token: Optional[str] = None  # Send as "Authorization: Bearer <token>" on votes
 
     class Config:
         from_attributes = True
@@ -68,6 +69,9 @@ class VoteResponse(BaseModel):
     movie_id: int
     participant_id: int
     liked: bool
+    matched: bool = False  # True when every participant has now liked this movie
+    # True when this vote completed the match; not sent, the endpoints report it as matches
+    completed_match: bool = Field(False, exclude=True)
 
     class Config:
         from_attributes = True
@@ -76,3 +80,14 @@ class VoteResponse(BaseModel):
 class MatchResponse(BaseModel):
     movie: MovieResponse
     participants: List[str]
+
+
+class VoteBatchResponse(BaseModel):
+    votes: List[VoteResponse]
+    matches: List[MatchResponse]  # Movies matched by votes in this batch
+
+
+class SwipeResponse(BaseModel):
+    vote: VoteResponse
+    match: Optional[MatchResponse] = None  # Set when this vote completed a match
+    next_movies: List[MovieResponse]  # Unvoted movies to append to the client's deck
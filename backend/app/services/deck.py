@@ -0,0 +1,214 @@
+"""The swipe deck: movies a participant can still vote on in a room.
+
+Each room has a precomputed deck (``room_deck``): its pool in a fixed order,
+shared by all participants so that they meet the same movies at the same
+time. Cards are appended whenever the pool grows, and every participant keeps
+the position of the last card they swiped, so dealing the next cards is a
+range read on ``(room_id, position)``.
+
+The room's movie list follows the deck too, so that a client can deal the
+cards after its last listed movie from the swipe endpoint. It is paged by
+keyset on the deck position of the last movie of the previous page. A
+participant's own unvoted list is read newest movie first and paged by keyset
+on ``Movie.id``. Either way, movies voted on in between simply drop out, so no
+card is skipped or repeated, and a deep page is an index range read just like
+the first.
+"""
+
+import base64
+
+from sqlalchemy import case, exists, func, literal, select, update
+from sqlalchemy.orm import Query, Session
+
+from ..database import dialect_insert
+from ..models import Movie, MovieAvailability, Participant, Room, RoomDeckCard, Vote
+
+
+def encode_cursor(movie_id: int) -> str:
+    """Opaque cursor for the page that follows the movie ``movie_id``."""
+    return base64.urlsafe_b64encode(f"movie:{movie_id}".encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Movie id carried by a cursor from ``encode_cursor``; ValueError if malformed."""
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    prefix, _, movie_id = decoded.partition(":")
+    if prefix != "movie" or not movie_id.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(movie_id)
+
+
+def extend_room_deck(db: Session, room: Room) -> int:
+    """Append the pool's movies missing from the room's deck, newest first.
+
+    One ``INSERT ... SELECT``; cards a concurrent extension already placed
+    are skipped, and any movie it misses is picked up by the next one.
+    Returns the number of cards added.
+    """
+    in_deck = exists().where(RoomDeckCard.room_id == room.id, RoomDeckCard.movie_id == Movie.id)
+    last_position = (
+        select(func.coalesce(func.max(RoomDeckCard.position), 0))
+        .where(RoomDeckCard.room_id == room.id)
+        .scalar_subquery()
+    )
+    cards = select(
+        literal(room.id),
+        last_position + func.row_number().over(order_by=Movie.id.desc()),
+        Movie.id,
+    ).where(_available(room), ~in_deck)
+
+    statement = (
+        dialect_insert(db)(RoomDeckCard)
+        .from_select(["room_id", "position", "movie_id"], cards)
+        .on_conflict_do_nothing()
+    )
+    added = db.execute(statement).rowcount
+    db.commit()
+    return added
+
+
+def advance_deck_cursor(db: Session, participant_id: int, movie_id: int) -> int:
+    """Move the participant's cursor up to the card of ``movie_id``; return the cursor.
+
+    The cursor never moves back, and stays put for a movie outside the deck.
+    """
+    card_position = (
+        select(RoomDeckCard.position)
+        .where(
+            RoomDeckCard.room_id == Participant.room_id,
+            RoomDeckCard.movie_id == movie_id,
+        )
+        .scalar_subquery()
+    )
+    statement = (
+        update(Participant)
+        .where(Participant.id == participant_id)
+        .values(
+            deck_position=case(
+                (card_position > Participant.deck_position, card_position),
+                else_=Participant.deck_position,
+            )
+        )
+        .returning(Participant.deck_position)
+        .execution_options(synchronize_session=False)
+    )
+    position = db.execute(statement).scalar_one()
+    db.commit()
+    return position
+
+
+def next_deck_cards(
+    db: Session,
+    room: Room,
+    participant_id: int,
+    after_position: int,
+    limit: int,
+    after_movie_id: int | None = None,
+) -> list[Movie]:
+    """Up to ``limit`` cards past ``after_position`` the participant has not voted on.
+
+    ``after_movie_id`` is the last card the client already holds; dealing
+    continues after it when it lies further in the deck. Extends the deck once
+    when it runs short, for rooms created before their pool was filled.
+    """
+    if limit <= 0:
+        return []
+
+    start = after_position
+    if after_movie_id is not None:
+        held_position = (
+            select(RoomDeckCard.position)
+            .where(RoomDeckCard.room_id == room.id, RoomDeckCard.movie_id == after_movie_id)
+            .scalar_subquery()
+        )
+        start = case(
+            (held_position > after_position, held_position),
+            else_=after_position,
+        )
+
+    # Cards behind the cursor may still have been voted on through the vote endpoints
+    voted = exists().where(Vote.participant_id == participant_id, Vote.movie_id == Movie.id)
+    query = (
+        db.query(Movie)
+        .join(RoomDeckCard, RoomDeckCard.movie_id == Movie.id)
+        .filter(RoomDeckCard.room_id == room.id, RoomDeckCard.position > start, ~voted)
+        .order_by(RoomDeckCard.position)
+        .limit(limit)
+    )
+    cards = query.all()
+    if len(cards) < limit and extend_room_deck(db, room):
+        cards = query.all()
+    return cards
+
+
+def room_movies_page(
+    db: Session, room: Room, limit: int, after_movie_id: int | None = None
+) -> tuple[list[Movie], int | None]:
+    """One page of the room's deck without the movies anyone in the room voted on.
+
+    ``after_movie_id`` is the last movie of the previous page. Returns the
+    movies and the id to continue after, or None on the last page. Extends the
+    deck once when it has nothing left to list; otherwise the swipe endpoint
+    extends it as the participants reach its end. ValueError if
+    ``after_movie_id`` is not in the room's deck.
+    """
+    start = literal(0)
+    if after_movie_id is not None:
+        # NULL for a movie outside the deck: the page comes back empty and is checked below
+        start = (
+            select(RoomDeckCard.position)
+            .where(RoomDeckCard.room_id == room.id, RoomDeckCard.movie_id == after_movie_id)
+            .scalar_subquery()
+        )
+
+    voted = exists().where(Vote.room_id == room.id, Vote.movie_id == Movie.id)
+    query = (
+        db.query(Movie)
+        .join(RoomDeckCard, RoomDeckCard.movie_id == Movie.id)
+        .filter(RoomDeckCard.room_id == room.id, RoomDeckCard.position > start, ~voted)
+        .order_by(RoomDeckCard.position)
+        .limit(limit + 1)
+    )
+    movies = query.all()
+    if not movies and after_movie_id is not None:
+        in_deck = exists().where(
+            RoomDeckCard.room_id == room.id, RoomDeckCard.movie_id == after_movie_id
+        )
+        if not db.query(in_deck).scalar():
+            raise ValueError(f"Movie {after_movie_id} is not in the room's deck")
+    if not movies and extend_room_deck(db, room):
+        movies = query.all()
+    if len(movies) > limit:
+        return movies[:limit], movies[limit - 1].id  # type: ignore[return-value]
+    return movies, None
+
+
+def unvoted_movies(
+    db: Session, room: Room, participant_id: int, before_id: int | None = None
+) -> Query:
+    """The room's pool without the participant's votes, newest first; unlimited.
+
+    ``before_id`` continues below the last movie of a previous page.
+    """
+    # A participant belongs to a single room, so their votes are already room-scoped
+    voted = exists().where(Vote.participant_id == participant_id, Vote.movie_id == Movie.id)
+    return _deck_query(db, room, voted, before_id)
+
+
+def _available(room: Room):
+    provider_ids: list[int] = room.provider_ids if room.provider_ids else [8]  # type: ignore
+    return exists().where(
+        MovieAvailability.movie_id == Movie.id,
+        MovieAvailability.region == room.region,
+        MovieAvailability.provider_id.in_(provider_ids),
+    )
+
+
+def _deck_query(db: Session, room: Room, voted, before_id: int | None) -> Query:
+    query = db.query(Movie).filter(_available(room), ~voted)
+    if before_id is not None:
+        query = query.filter(Movie.id < before_id)
+    return query.order_by(Movie.id.desc())
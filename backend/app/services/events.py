@@ -0,0 +1,221 @@
+"""Pub/sub for room events (matches, joins, votes).
+
+Publishers are usually sync route handlers running in the threadpool, while
+subscribers are async streaming handlers on the event loop, so delivery goes
+through ``loop.call_soon_threadsafe``.
+
+With a single process, events are dispatched in memory. On PostgreSQL the
+broker is switched to ``pg_notify`` so that every ECS task sees every event:
+each process keeps one ``LISTEN`` connection and dispatches what it receives
+to its own subscribers.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL NOTIFY channel shared by all backend processes
+ROOM_EVENTS_CHANNEL = "room_events"
+
+# How long the listener blocks waiting for notifications before checking for shutdown
+LISTEN_POLL_SECONDS = 0.5
+
+# Seconds to wait before reconnecting a dropped listener connection
+LISTEN_RECONNECT_SECONDS = 2.0
+
+# Listener lag above this is logged as a warning
+LISTEN_LAG_WARNING_SECONDS = 1.0
+
+
+class RoomSubscription:
+    """A single listener on a room's events."""
+
+    def __init__(self, room_id: int, loop: asyncio.AbstractEventLoop):
+        self.room_id = room_id
+        self.loop = loop
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Wait for the next event, or return None when the timeout expires."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class PostgresListener:
+    """One LISTEN connection per process, relaying notifications to the broker."""
+
+    def __init__(self, engine: Engine, broker: "RoomEventBroker"):
+        self.engine = engine
+        self.broker = broker
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="room-events-listener", daemon=True)
+        self.events_received = 0
+        self.reconnects = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._total_lag_ms = 0.0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=LISTEN_POLL_SECONDS * 4)
+
+    def send(self, room_id: int, event: dict[str, Any]) -> None:
+        payload = json.dumps({"room_id": room_id, "event": event, "sent_at": time.time()})
+        with self.engine.connect() as conn:
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": ROOM_EVENTS_CHANNEL, "payload": payload},
+            )
+            conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        received = self.events_received
+        return {
+            "transport": "postgres",
+            "listening": self._thread.is_alive(),
+            "events_received": received,
+            "reconnects": self.reconnects,
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "avg_lag_ms": round(self._total_lag_ms / received, 2) if received else 0.0,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                if self._stop.is_set():
+                    return
+                self.reconnects += 1
+                logger.warning(f"Room event listener dropped, reconnecting: {e}")
+                self._stop.wait(LISTEN_RECONNECT_SECONDS)
+
+    def _listen(self) -> None:
+        # Dedicated connection taken out of the engine's pool for the process lifetime
+        pooled = self.engine.raw_connection()
+        conn = pooled.driver_connection
+        pooled.detach()
+        try:
+            conn.autocommit = True  # ty: ignore[invalid-assignment]
+            conn.execute(f"LISTEN {ROOM_EVENTS_CHANNEL}")  # ty: ignore[possibly-missing-attribute]
+            logger.info(f"Listening for room events on '{ROOM_EVENTS_CHANNEL}'")
+            while not self._stop.is_set():
+                for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):  # ty: ignore
+                    self._handle(notify.payload)
+        finally:
+            pooled.close()
+
+    def _handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            room_id, event = int(message["room_id"]), message["event"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed room event: {payload!r}")
+            return
+
+        lag_ms = max(0.0, (time.time() - float(message.get("sent_at", time.time()))) * 1000)
+        self.events_received += 1
+        self.last_lag_ms = lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self._total_lag_ms += lag_ms
+        if lag_ms > LISTEN_LAG_WARNING_SECONDS * 1000:
+            logger.warning(f"Room event delivered {lag_ms:.0f}ms after publish")
+
+        self.broker.dispatch(room_id, event)
+
+
+class RoomEventBroker:
+    """Fan out room events to the subscribers of this process."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[int, set[RoomSubscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._listener: PostgresListener | None = None
+        self._handlers: list[Callable[[int, dict[str, Any]], None]] = []
+
+    def add_handler(self, handler: Callable[[int, dict[str, Any]], None]) -> None:
+        """Call ``handler(room_id, event)`` for every event this process receives.
+
+        Handlers run synchronously on the delivering thread and must be quick.
+        """
+        self._handlers.append(handler)
+
+    def subscribe(self, room_id: int) -> RoomSubscription:
+        """Register a listener; must be called from the event loop."""
+        subscription = RoomSubscription(room_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[room_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: RoomSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.room_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.room_id]
+
+    def publish(self, room_id: int, event: dict[str, Any]) -> None:
+        """Publish an event to the room's listeners in every process. Safe from any thread."""
+        if self._listener is None:
+            self.dispatch(room_id, event)
+            return
+        try:
+            self._listener.send(room_id, event)
+        except Exception as e:
+            # Events are notifications only; never fail the write that produced them
+            logger.warning(f"Failed to publish room event, delivering locally: {e}")
+            self.dispatch(room_id, event)
+
+    def dispatch(self, room_id: int, event: dict[str, Any]) -> None:
+        """Deliver an event to this process's listeners of the room."""
+        for handler in self._handlers:
+            try:
+                handler(room_id, event)
+            except Exception as e:
+                logger.warning(f"Room event handler failed: {e}")
+        with self._lock:
+            subscribers = list(self._subscribers.get(room_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.queue.put_nowait, event)
+            except RuntimeError:
+                # Event loop already closed; the subscriber is gone
+                self.unsubscribe(subscription)
+
+    def start(self, engine: Engine) -> None:
+        """Switch to cross-process delivery when running on PostgreSQL."""
+        if engine.dialect.name != "postgresql" or self._listener is not None:
+            return
+        self._listener = PostgresListener(engine, self)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def stats(self) -> dict[str, Any]:
+        """Delivery metrics, including listener lag on PostgreSQL."""
+        if self._listener is None:
+            return {"transport": "memory"}
+        return self._listener.stats()
+
+
+broker = RoomEventBroker()
@@ -0,0 +1,128 @@
+"""Background hydration of TMDB movie details.
+
+Movies of a discover page are stored right away from the discover results,
+with ``hydrated_at`` unset. Genre names, trailer, backdrop and rating need a
+``/movie/{id}`` call each; ``MovieHydrator`` makes those calls on its own
+thread and session, so that filling a pool only waits for the discover page.
+``get_movie_detail`` hydrates a movie on demand if the worker has not yet.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..database import SessionLocal
+from ..models import Movie
+from .tmdb import TMDB_API_KEY, get_image_url, get_movies_details, get_trailer_key
+
+logger = logging.getLogger(__name__)
+
+# Movies hydrated per round of detail requests and commit
+HYDRATION_BATCH_SIZE = 20
+
+# Unhydrated movies, e.g. after a failed fetch, are retried this often
+HYDRATION_POLL_SECONDS = 60.0
+
+
+def detail_columns(details: dict) -> dict:
+    """Movie column values taken from TMDB movie details."""
+    backdrop_path = details.get("backdrop_path")
+    return {
+        "genre": ", ".join(g["name"] for g in details.get("genres", [])[:3]),
+        "trailer_key": get_trailer_key(details.get("videos", {})),
+        "backdrop_url": get_image_url(backdrop_path, "w780") if backdrop_path else None,
+        # Store as integer (e.g., 87 for 8.7)
+        "rating": int(details.get("vote_average", 0) * 10),
+    }
+
+
+def hydrate_movies(db: Session, movies: list[Movie]) -> int:
+    """Fill in the TMDB details of movies and mark them hydrated, in one commit.
+
+    Movies whose details could not be fetched stay unhydrated. Returns how
+    many movies were hydrated.
+    """
+    details = get_movies_details(db, [int(m.tmdb_id) for m in movies if m.tmdb_id is not None])
+    now = datetime.now(timezone.utc)
+    hydrated = 0
+    for movie in movies:
+        data = details.get(movie.tmdb_id)  # type: ignore[arg-type]
+        if data is None:
+            continue
+        for column, value in detail_columns(data).items():
+            setattr(movie, column, value)
+        movie.hydrated_at = now  # type: ignore[assignment]
+        hydrated += 1
+    db.commit()
+    return hydrated
+
+
+class MovieHydrator:
+    """One thread per process hydrating movies stored from discover results only."""
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        self.session_factory = session_factory
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker; without a TMDB API key there is nothing to hydrate from."""
+        if not TMDB_API_KEY or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="movie-hydrator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def schedule(self) -> None:
+        """Wake the worker because unhydrated movies were stored. Safe from any thread."""
+        self._wake.set()
+
+    def drain(self) -> int:
+        """Hydrate every movie that is unhydrated now, a batch at a time.
+
+        Each movie is tried once per call, so failing fetches cannot keep the
+        worker busy. Returns how many movies were hydrated.
+        """
+        hydrated = 0
+        after_id = 0
+        with self.session_factory() as db:
+            while not self._stop.is_set():
+                movies = (
+                    db.query(Movie)
+                    .filter(
+                        Movie.hydrated_at.is_(None),
+                        Movie.tmdb_id.isnot(None),
+                        Movie.id > after_id,
+                    )
+                    .order_by(Movie.id)
+                    .limit(HYDRATION_BATCH_SIZE)
+                    .all()
+                )
+                if not movies:
+                    break
+                after_id = movies[-1].id  # type: ignore[assignment]
+                hydrated += hydrate_movies(db, movies)
+        return hydrated
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(HYDRATION_POLL_SECONDS)
+            self._wake.clear()
+            try:
+                self.drain()
+            except Exception as e:
+                logger.warning(f"Movie hydration failed, retrying later: {e}")
+
+
+hydrator = MovieHydrator()
@@ -0,0 +1,87 @@
+"""Room match bookkeeping, maintained at vote time."""
+
+from sqlalchemy import distinct, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models import Movie, Participant, RoomMatch, Vote
+from ..schemas import MatchResponse
+from .events import broker
+from .room_version import bump_room_version
+from .vote_index import vote_index
+
+
+def sync_room_match(db: Session, room_id: int, movie_id: int) -> tuple[bool, bool]:
+    """Record or clear the match for a movie after a vote on it.
+
+    Must run after the vote is committed so that a concurrent vote from the
+    other participant is visible. Returns whether the movie is now a match, and
+    whether this call recorded it: a vote repeated on a match completes nothing.
+    """
+    participant_count = db.query(Participant).filter(Participant.room_id == room_id).count()
+    liked_count = (
+        db.query(func.count(distinct(Vote.participant_id)))
+        .filter(Vote.room_id == room_id, Vote.movie_id == movie_id, Vote.liked.is_(True))
+        .scalar()
+    )
+    matched = participant_count >= 2 and liked_count == participant_count
+
+    existing = (
+        db.query(RoomMatch)
+        .filter(RoomMatch.room_id == room_id, RoomMatch.movie_id == movie_id)
+        .first()
+    )
+
+    recorded = False
+    if matched and not existing:
+        room_match = RoomMatch(room_id=room_id, movie_id=movie_id)
+        db.add(room_match)
+        version = bump_room_version(db, room_id)
+        try:
+            db.flush()
+            match_id = room_match.id
+            db.commit()
+        except IntegrityError:
+            # The other participant's vote recorded the same match concurrently
+            db.rollback()
+        else:
+            recorded = True
+            vote_index.advance(room_id, version)
+            broker.publish(room_id, {"type": "match", "id": match_id, "movie_id": movie_id})
+    elif not matched and existing:
+        db.delete(existing)
+        version = bump_room_version(db, room_id)
+        db.commit()
+        vote_index.advance(room_id, version)
+        # Subscribers drop the match they were shown
+        broker.publish(room_id, {"type": "unmatch", "movie_id": movie_id})
+
+    return matched, recorded
+
+
+def describe_matches(db: Session, room_id: int, movie_ids: list[int]) -> list[MatchResponse]:
+    """Match payloads for movies just matched in the room, in no particular order."""
+    if not movie_ids:
+        return []
+    names = [name for (name,) in db.query(Participant.name).filter(Participant.room_id == room_id)]
+    movies = db.query(Movie).filter(Movie.id.in_(movie_ids)).all()
+    return [MatchResponse(movie=movie, participants=names) for movie in movies]  # type: ignore
+
+
+def load_matches_since(
+    db: Session, room_id: int, last_match_id: int = 0
+) -> list[tuple[int, MatchResponse]]:
+    """Load the room's matches recorded after the given match id, oldest first."""
+    participants = db.query(Participant).filter(Participant.room_id == room_id).all()
+    participant_names = [p.name for p in participants]
+    rows = (
+        db.query(RoomMatch, Movie)
+        .join(Movie, RoomMatch.movie_id == Movie.id)
+        .filter(RoomMatch.room_id == room_id, RoomMatch.id > last_match_id)
+        .order_by(RoomMatch.id)
+        .all()
+    )
+    return [
+        (room_match.id, MatchResponse(movie=movie, participants=participant_names))  # type: ignore
+        for room_match, movie in rows
+    ]
@@ -0,0 +1,63 @@
+"""Per-request SQL statement counts and database time.
+
+Cursor events on the engine add to the stats of the request being served,
+found through a context variable. Sync route handlers run in the threadpool
+with a copy of the request's context, so they share the same stats object.
+Statements issued outside a tracked request are not counted.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    seconds: float = 0.0
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value for these stats."""
+        plural = "" if self.statements == 1 else "s"
+        return f'db;dur={self.seconds * 1000:.2f};desc="{self.statements} statement{plural}"'
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements issued in this context until the block exits."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    started = getattr(context, "query_started_at", None)
+    if started is not None:
+        stats.seconds += time.perf_counter() - started
+    stats.statements += 1
+
+
+def instrument(engine: Engine) -> None:
+    """Attach the statement counters to an engine; safe to call more than once."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,47 @@
+"""Per-room version counter backing ETag / 304 responses on room reads."""
+
+from fastapi import Request, Response
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ..models import Room
+
+
+def bump_room_version(db: Session, room_id: int) -> int:
+    """Increment the room's version inside the caller's pending transaction.
+
+    Call it in the same transaction as the write it describes, so that a reader
+    never sees a version whose content is older than the write. Returns the new
+    version, which identifies the write once committed.
+    """
+    statement = (
+        update(Room)
+        .where(Room.id == room_id)
+        .values(version=Room.version + 1)
+        .returning(Room.version)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(statement).scalar_one()
+
+
+def room_etag(room: Room, *variant: object) -> str:
+    """Weak ETag for a view of the room; ``variant`` distinguishes views of one room."""
+    suffix = "".join(f".{part}" for part in variant)
+    return f'W/"{room.id}.{room.version or 0}{suffix}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response when the client already holds this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    # Weak comparison: W/"x" and "x" name the same version
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag.removeprefix("W/") in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
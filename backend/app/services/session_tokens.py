@@ -0,0 +1,171 @@
+"""Signed, expiring participant tokens, verified without touching the database.
+
+``join_room`` hands out a token naming the room, its code and the participant.
+Vote endpoints that receive one as ``Authorization: Bearer <token>`` skip the
+room and participant lookups; without a valid token they fall back to the
+``session_id`` cookie.
+
+Each room signs with its own key, derived from the server secret and the
+room's ``token_key``. Rotating ``token_key`` revokes every token of the room.
+Room keys are cached per process; a rotation is announced on the room event
+bus so that every process drops its cached key.
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Request
+from sqlalchemy.orm import Session
+
+from ..models import Participant, Room
+from .events import broker
+
+logger = logging.getLogger(__name__)
+
+SESSION_TOKEN_SECRET = os.getenv("SESSION_TOKEN_SECRET", "")
+if not SESSION_TOKEN_SECRET:
+    # Tokens then only verify in the process that issued them; others use the cookie
+    logger.warning("SESSION_TOKEN_SECRET is not set; using a per-process secret")
+    SESSION_TOKEN_SECRET = secrets.token_hex(32)
+
+# How long an issued token stays valid
+SESSION_TOKEN_TTL_SECONDS = int(os.getenv("SESSION_TOKEN_TTL_SECONDS", str(24 * 60 * 60)))
+
+# Upper bound on how long another process may keep accepting a rotated key
+ROOM_KEY_CACHE_SECONDS = 60.0
+
+ROOM_KEY_ROTATED = "room_key_rotated"
+
+
+@dataclass(frozen=True)
+class TokenIdentity:
+    room_id: int
+    participant_id: int
+
+
+class RoomKeyCache:
+    """Per-room signing keys with a short time-to-live. Safe from any thread."""
+
+    def __init__(self, ttl: float = ROOM_KEY_CACHE_SECONDS):
+        self.ttl = ttl
+        self._keys: dict[int, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, room_id: int) -> bytes | None:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._keys.get(room_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        row = db.query(Room.token_key).filter(Room.id == room_id).first()
+        if row is None:
+            return None
+        return self.remember(room_id, row[0])
+
+    def remember(self, room_id: int, token_key: str | None) -> bytes:
+        key = _derive_key(room_id, token_key)
+        with self._lock:
+            self._keys[room_id] = (key, time.monotonic() + self.ttl)
+        return key
+
+    def invalidate(self, room_id: int) -> None:
+        with self._lock:
+            self._keys.pop(room_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+room_keys = RoomKeyCache()
+
+
+def _derive_key(room_id: int, token_key: str | None) -> bytes:
+    material = f"{room_id}:{token_key or ''}".encode()
+    return hmac.new(SESSION_TOKEN_SECRET.encode(), material, hashlib.sha256).digest()
+
+
+def _sign(key: bytes, payload: str) -> str:
+    digest = hmac.new(key, payload.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def issue_token(room: Room, participant_id: int) -> str:
+    """Token for a participant of ``room``, valid for SESSION_TOKEN_TTL_SECONDS."""
+    expires = int(time.time()) + SESSION_TOKEN_TTL_SECONDS
+    payload = f"{room.id}.{participant_id}.{room.code}.{expires}"
+    key = room_keys.remember(room.id, room.token_key)  # type: ignore[arg-type]
+    return f"{payload}.{_sign(key, payload)}"
+
+
+def verify_token(db: Session, token: str, code: str) -> TokenIdentity | None:
+    """Identity carried by a valid, unexpired token for the room ``code``, or None."""
+    try:
+        room_id, participant_id, token_code, expires, signature = token.split(".")
+        identity = TokenIdentity(int(room_id), int(participant_id))
+        expired = int(expires) < time.time()
+    except ValueError:
+        return None
+    if token_code != code or expired:
+        return None
+
+    key = room_keys.get(db, identity.room_id)
+    payload = token.rsplit(".", 1)[0]
+    if key is None or not hmac.compare_digest(signature, _sign(key, payload)):
+        return None
+    return identity
+
+
+def get_bearer_token(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    return token if scheme.lower() == "bearer" and token else None
+
+
+def resolve_voter(db: Session, code: str, request: Request) -> TokenIdentity:
+    """Identify the participant voting in room ``code``: token first, then session cookie.
+
+    Raises 404 for an unknown room and 403 for a caller who is not a participant.
+    """
+    token = get_bearer_token(request)
+    if token and (identity := verify_token(db, token, code)):
+        return identity
+
+    room = db.query(Room).filter(Room.code == code).first()
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+
+    session_id = request.cookies.get("session_id", "")
+    participant = (
+        db.query(Participant)
+        .filter(Participant.room_id == room.id, Participant.session_id == session_id)
+        .first()
+    )
+    if not participant:
+        raise HTTPException(status_code=403, detail="Not a participant in this room")
+
+    return TokenIdentity(room.id, participant.id)  # type: ignore[arg-type]
+
+
+def rotate_room_key(db: Session, room: Room) -> None:
+    """Give the room a new signing key, revoking all its tokens in every process."""
+    room.token_key = secrets.token_hex(16)  # type: ignore[assignment]
+    db.commit()
+    room_keys.invalidate(room.id)  # type: ignore[arg-type]
+    broker.publish(room.id, {"type": ROOM_KEY_ROTATED})  # type: ignore[arg-type]
+
+
+def _on_room_event(room_id: int, event: dict[str, Any]) -> None:
+    if event.get("type") == ROOM_KEY_ROTATED:
+        room_keys.invalidate(room_id)
+
+
+broker.add_handler(_on_room_event)
@@ -0,0 +1,80 @@
+"""The static movie catalog, used instead of TMDB when no API key is set.
+
+The movies of ``data/movies.json`` are inserted once, in bulk, at startup.
+Their availability is recorded per (region, provider) the first time a room
+asks for it, and a ``StaticCatalogSeed`` marker records that it was done, so
+rooms never scan the catalog again once their region and providers are seeded.
+"""
+
+import json
+from pathlib import Path
+
+from sqlalchemy import exists, literal, select, text, true
+from sqlalchemy.orm import Session
+
+from ..database import dialect_insert
+from ..models import Movie, MovieAvailability, StaticCatalogSeed
+
+_MOVIES_FILE = Path(__file__).parent.parent / "data" / "movies.json"
+
+with open(_MOVIES_FILE) as f:
+    STATIC_MOVIES: list[dict] = json.load(f)
+
+# Region and providers of a room created without preferences
+DEFAULT_REGION = "US"
+DEFAULT_PROVIDER_IDS = [8]
+
+# Serializes first-boot seeding across processes on PostgreSQL
+STATIC_SEED_LOCK_ID = 54292
+
+
+def seed_static_catalog(
+    db: Session, region: str = DEFAULT_REGION, provider_ids: list[int] | None = None
+) -> bool:
+    """Make the static catalog available on providers in a region, once.
+
+    Costs one marker lookup when already done. Otherwise inserts the static
+    movies if there are no movies at all, then records every movie's
+    availability with one ``INSERT ... SELECT`` per missing provider, and
+    the markers, in a single transaction. Returns whether anything was seeded.
+    """
+    provider_ids = list(dict.fromkeys(provider_ids or DEFAULT_PROVIDER_IDS))
+    seeded = {
+        provider_id
+        for (provider_id,) in db.query(StaticCatalogSeed.provider_id).filter(
+            StaticCatalogSeed.region == region,
+            StaticCatalogSeed.provider_id.in_(provider_ids),
+        )
+    }
+    missing = [provider_id for provider_id in provider_ids if provider_id not in seeded]
+    if not missing:
+        return False
+
+    if db.get_bind().dialect.name == "postgresql":
+        # Two processes booting on an empty database must not both insert the catalog
+        db.execute(text(f"SELECT pg_advisory_xact_lock({STATIC_SEED_LOCK_ID})"))
+    if not db.query(exists().where(Movie.id.isnot(None))).scalar():
+        db.execute(dialect_insert(db)(Movie).values(STATIC_MOVIES))
+
+    insert = dialect_insert(db)
+    for provider_id in missing:
+        # SQLite needs a WHERE to tell the ON CONFLICT clause from a join constraint
+        movies = select(Movie.id, literal(region), literal(provider_id)).where(true())
+        db.execute(
+            insert(MovieAvailability)
+            .from_select(["movie_id", "region", "provider_id"], movies)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    MovieAvailability.movie_id,
+                    MovieAvailability.region,
+                    MovieAvailability.provider_id,
+                ]
+            )
+        )
+    db.execute(
+        insert(StaticCatalogSeed)
+        .values([{"region": region, "provider_id": provider_id} for provider_id in missing])
+        .on_conflict_do_nothing()
+    )
+    db.commit()
+    return True
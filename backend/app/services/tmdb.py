@@ -1,6 +1,9 @@
 """TMDB API client with caching."""
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -17,6 +20,12 @@ TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
 # Cache TTL: 24 hours
 CACHE_TTL_HOURS = 24
 
+# Language of the discover results, and so of the genre names stored with them
+TMDB_LANGUAGE = "en-US"
+
+# How many movie detail requests run at once when a discover page is stored
+TMDB_DETAIL_CONCURRENCY = int(os.getenv("TMDB_DETAIL_CONCURRENCY", "8"))
+
 
 class TMDBCache(Base):
     """Cache for TMDB API responses."""
@@ -66,8 +75,13 @@ def set_cache(db: Session, cache_key: str, data: dict) -> None:
     db.commit()
 
 
-def _make_request(endpoint: str, params: dict | None = None) -> dict:
-    """Make authenticated request to TMDB API."""
+def _make_request(
+    endpoint: str, params: dict | None = None, client: httpx.Client | None = None
+) -> dict:
+    """Make authenticated request to TMDB API.
+
+    Pass ``client`` to reuse its connections; it may be shared between threads.
+    """
     if not TMDB_API_KEY:
         raise ValueError("TMDB_API_KEY environment variable is not set")
 
@@ -76,10 +90,16 @@ def _make_request(endpoint: str, params: dict | None = None) -> dict:
     request_params = params or {}
     request_params["api_key"] = TMDB_API_KEY
 
-    with httpx.Client() as client:
-        response = client.get(url, params=request_params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    if client is None:
+        with httpx.Client() as client:
+            return _get_json(client, url, request_params)
+    return _get_json(client, url, request_params)
+
+
+def _get_json(client: httpx.Client, url: str, params: dict) -> dict:
+    response = client.get(url, params=params, timeout=30.0)
+    response.raise_for_status()
+    return response.json()
 
 
 def discover_movies(
@@ -139,6 +159,44 @@ def get_movie_details(db: Session, tmdb_id: int) -> dict:
     return data
 
 
+def get_movies_details(db: Session, tmdb_ids: list[int]) -> dict[int, dict]:
+    """Get the details of several movies, fetching the uncached ones concurrently.
+
+    At most TMDB_DETAIL_CONCURRENCY requests run at once, sharing one HTTP
+    client. Only the HTTP calls run in worker threads: the cache is read and
+    written here, on the caller's thread, because the session is not
+    thread-safe. Movies whose details could not be fetched are left out.
+    """
+    details: dict[int, dict] = {}
+    missing = []
+    for tmdb_id in dict.fromkeys(tmdb_ids):
+        cached = get_cache(db, f"movie:{tmdb_id}:details")
+        if cached:
+            details[tmdb_id] = cached
+        else:
+            missing.append(tmdb_id)
+    if not missing:
+        return details
+
+    def fetch(client: httpx.Client, tmdb_id: int) -> dict | None:
+        try:
+            return _make_request(
+                f"/movie/{tmdb_id}", {"append_to_response": "videos,credits"}, client
+            )
+        except Exception:
+            return None
+
+    workers = max(1, min(TMDB_DETAIL_CONCURRENCY, len(missing)))
+    with httpx.Client() as client, ThreadPoolExecutor(max_workers=workers) as pool:
+        fetched = list(pool.map(lambda tmdb_id: fetch(client, tmdb_id), missing))
+
+    for tmdb_id, data in zip(missing, fetched):
+        if data is not None:
+            set_cache(db, f"movie:{tmdb_id}:details", data)
+            details[tmdb_id] = data
+    return details
+
+
 def get_movie_images(db: Session, tmdb_id: int) -> dict:
     """Get movie posters and backdrops."""
     cache_key = f"movie:{tmdb_id}:images"
@@ -156,6 +214,44 @@ def get_movie_images(db: Session, tmdb_id: int) -> dict:
     return data
 
 
+class GenreCatalog:
+    """TMDB movie genre names by id, per language.
+
+    Fetched from ``/genre/movie/list`` once, kept in TMDBCache and in process
+    for CACHE_TTL_HOURS. Safe from any thread.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL_HOURS * 3600):
+        self.ttl = ttl
+        self._names: dict[str, tuple[dict[int, str], float]] = {}
+        self._lock = threading.Lock()
+
+    def names(self, db: Session, language: str = TMDB_LANGUAGE) -> dict[int, str]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._names.get(language)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        cache_key = f"genres:movie:{language}"
+        data = get_cache(db, cache_key)
+        if not data:
+            data = _make_request("/genre/movie/list", {"language": language})
+            set_cache(db, cache_key, data)
+
+        names = {int(genre["id"]): genre["name"] for genre in data.get("genres", [])}
+        with self._lock:
+            self._names[language] = (names, now + self.ttl)
+        return names
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+
+
+genre_catalog = GenreCatalog()
+
+
 def get_image_url(path: str | None, size: str = "w342") -> str | None:
     """Build full TMDB image URL from path."""
     if not path:
@@ -0,0 +1,211 @@
+"""In-memory per-room vote bitmaps, so a vote can be checked for a match without SQL.
+
+Each cached room gives every movie voted on in it a bit position, and keeps
+two bitsets per participant: the movies they voted on and the movies they
+liked. A movie is a match when its bit is set in every participant's liked
+bitset, so the check after a vote is a handful of integer ANDs.
+
+Entries are tagged with the room version they reflect. A vote is applied in
+place only when it is the very next write to the room; any gap (a vote
+handled by another ECS task, a join, a pool top-up) makes the entry stale and
+it is rebuilt from the ``votes`` table on the next vote. Rooms are evicted
+least recently used once the estimated footprint exceeds the memory cap.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from ..models import Participant, Room, Vote
+
+# Upper bound on the estimated memory held by cached rooms
+VOTE_INDEX_MAX_BYTES = int(os.getenv("VOTE_INDEX_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# Rough per-entry cost of the movie id -> bit position dict
+_POSITION_ENTRY_BYTES = 100
+
+
+@dataclass
+class MatchChange:
+    """Whether a voted movie was a match before the vote, and is one after."""
+
+    was_match: bool
+    is_match: bool
+
+
+@dataclass
+class VoteOutcome:
+    """What the index knows once a participant's votes are applied."""
+
+    changes: list[MatchChange]
+    vote_count: int
+
+
+class RoomVotes:
+    """Vote bitmaps for one room, as of ``version``."""
+
+    def __init__(self, version: int, participant_ids: list[int]):
+        self.version = version
+        self.positions: dict[int, int] = {}
+        self.voted: dict[int, int] = dict.fromkeys(participant_ids, 0)
+        self.liked: dict[int, int] = dict.fromkeys(participant_ids, 0)
+
+    def apply(self, participant_id: int, movie_id: int, liked: bool) -> None:
+        position = self.positions.setdefault(movie_id, len(self.positions))
+        mask = 1 << position
+        self.voted[participant_id] = self.voted.get(participant_id, 0) | mask
+        if liked:
+            self.liked[participant_id] = self.liked.get(participant_id, 0) | mask
+        else:
+            self.liked[participant_id] = self.liked.get(participant_id, 0) & ~mask
+
+    def is_match(self, movie_id: int) -> bool:
+        position = self.positions.get(movie_id)
+        if position is None or len(self.liked) < 2:
+            return False
+        mask = 1 << position
+        return all(bits & mask for bits in self.liked.values())
+
+    def vote_count(self, participant_id: int) -> int:
+        return self.voted.get(participant_id, 0).bit_count()
+
+    def size(self) -> int:
+        """Estimated memory footprint in bytes."""
+        bitsets = sum(sys.getsizeof(bits) for bits in (*self.voted.values(), *self.liked.values()))
+        return _POSITION_ENTRY_BYTES * len(self.positions) + bitsets
+
+
+class VoteIndex:
+    """Bounded LRU of room vote bitmaps. Safe to use from any thread."""
+
+    def __init__(self, max_bytes: int = VOTE_INDEX_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._rooms: OrderedDict[int, RoomVotes] = OrderedDict()
+        self._sizes: dict[int, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rebuilds = 0
+        self.evictions = 0
+
+    def record(
+        self,
+        db: Session,
+        room_id: int,
+        version: int,
+        participant_id: int,
+        votes: list[tuple[int, bool]],
+    ) -> VoteOutcome:
+        """Apply a participant's committed votes that together moved the room to ``version``.
+
+        ``votes`` are ``(movie_id, liked)`` pairs on distinct movies. Falls back
+        to rebuilding the room from the database when the cached entry does not
+        end right before this write. ``was_match`` is then reported as True,
+        since the previous state of the movies is unknown; the same goes for an
+        entry rebuilt by another thread after this write, which already holds it.
+        """
+        with self._lock:
+            room = self._get(room_id)
+            if room is not None and room.version >= version - 1:
+                self.hits += 1
+                if room.version == version - 1:
+                    before = [room.is_match(movie_id) for movie_id, _ in votes]
+                    for movie_id, liked in votes:
+                        room.apply(participant_id, movie_id, liked)
+                    room.version = version
+                    self._resize(room_id, room)
+                else:
+                    before = [True] * len(votes)
+                return self._outcome(room, participant_id, votes, before)
+
+        room = self._install(room_id, self._load(db, room_id))
+        with self._lock:
+            return self._outcome(room, participant_id, votes, [True] * len(votes))
+
+    def advance(self, room_id: int, version: int) -> None:
+        """Note a write that moved the room to ``version`` without changing votes."""
+        with self._lock:
+            room = self._rooms.get(room_id)
+            if room is not None and room.version == version - 1:
+                room.version = version
+
+    def discard(self, room_id: int) -> None:
+        with self._lock:
+            if room_id in self._rooms:
+                del self._rooms[room_id]
+                self._total_bytes -= self._sizes.pop(room_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rooms.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "rooms": len(self._rooms),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "rebuilds": self.rebuilds,
+                "evictions": self.evictions,
+            }
+
+    @staticmethod
+    def _outcome(
+        room: RoomVotes, participant_id: int, votes: list[tuple[int, bool]], before: list[bool]
+    ) -> VoteOutcome:
+        changes = [
+            MatchChange(was_match, room.is_match(movie_id))
+            for (movie_id, _), was_match in zip(votes, before)
+        ]
+        return VoteOutcome(changes, room.vote_count(participant_id))
+
+    def _get(self, room_id: int) -> RoomVotes | None:
+        room = self._rooms.get(room_id)
+        if room is not None:
+            self._rooms.move_to_end(room_id)
+        return room
+
+    def _load(self, db: Session, room_id: int) -> RoomVotes:
+        # Version first: the votes read afterwards are at least as recent as it
+        version = db.query(Room.version).filter(Room.id == room_id).scalar() or 0
+        participant_ids = [
+            row[0] for row in db.query(Participant.id).filter(Participant.room_id == room_id)
+        ]
+        room = RoomVotes(version, participant_ids)
+        votes = db.query(Vote.participant_id, Vote.movie_id, Vote.liked).filter(
+            Vote.room_id == room_id
+        )
+        for participant_id, movie_id, liked in votes:
+            room.apply(participant_id, movie_id, liked)
+        return room
+
+    def _install(self, room_id: int, loaded: RoomVotes) -> RoomVotes:
+        with self._lock:
+            self.rebuilds += 1
+            current = self._get(room_id)
+            # A concurrent rebuild may already have installed a newer snapshot
+            if current is not None and current.version >= loaded.version:
+                return current
+            self._rooms[room_id] = loaded
+            self._rooms.move_to_end(room_id)
+            self._resize(room_id, loaded)
+            return loaded
+
+    def _resize(self, room_id: int, room: RoomVotes) -> None:
+        size = room.size()
+        self._total_bytes += size - self._sizes.get(room_id, 0)
+        self._sizes[room_id] = size
+        # Never evict the room just written, even if it alone exceeds the cap
+        while self._total_bytes > self.max_bytes and len(self._rooms) > 1:
+            evicted, _ = self._rooms.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+
+vote_index = VoteIndex()
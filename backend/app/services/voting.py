@@ -0,0 +1,62 @@
+"""Vote recording shared by the HTTP and WebSocket entry points."""
+
+from sqlalchemy.orm import Session
+
+from ..database import dialect_insert
+from ..models import Vote
+from ..schemas import VoteCreate, VoteResponse
+from .events import broker
+from .matches import sync_room_match
+from .room_version import bump_room_version
+from .vote_index import vote_index
+
+
+def record_vote(db: Session, room_id: int, participant_id: int, vote: VoteCreate) -> VoteResponse:
+    """Create or update a participant's vote and keep the room's matches in sync."""
+    return record_votes(db, room_id, participant_id, [vote])[0]
+
+
+def record_votes(
+    db: Session, room_id: int, participant_id: int, votes: list[VoteCreate]
+) -> list[VoteResponse]:
+    """Create or update several votes of one participant in a single transaction.
+
+    The votes are written with one ``INSERT ... ON CONFLICT DO UPDATE``, so a
+    double-tap can never create a duplicate row. A movie voted on more than
+    once in ``votes`` keeps its last vote. The room's vote bitmaps decide which
+    votes can change a match; only those are checked and recorded in SQL.
+    Results are returned in the order of the distinct movies.
+    """
+    latest = {vote.movie_id: vote.liked for vote in votes}
+    if not latest:
+        return []
+
+    insert = dialect_insert(db)
+    statement = insert(Vote).values(
+        [
+            {"room_id": room_id, "participant_id": participant_id, "movie_id": m, "liked": liked}
+            for m, liked in latest.items()
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[Vote.room_id, Vote.participant_id, Vote.movie_id],
+        set_={"liked": statement.excluded.liked},
+    ).returning(Vote.id, Vote.movie_id, Vote.participant_id, Vote.liked)
+
+    version = bump_room_version(db, room_id)
+    saved = {row.movie_id: VoteResponse.model_validate(row) for row in db.execute(statement)}
+    db.commit()
+    responses = [saved[movie_id] for movie_id in latest]
+
+    outcome = vote_index.record(db, room_id, version, participant_id, list(latest.items()))
+    for response, change in zip(responses, outcome.changes):
+        if change.is_match or change.was_match:
+            response.matched, response.completed_match = sync_room_match(
+                db, room_id, response.movie_id
+            )
+
+    broker.publish(
+        room_id,
+        {"type": "votes", "participant_id": participant_id, "count": outcome.vote_count},
+    )
+    return responses
@@ -0,0 +1,171 @@
+"""
+Fixtures for the hot path benchmarks.
+
+Every benchmark runs once per backend against a synthetic catalog: 10k movies,
+availability rows for several regions/providers, and rooms with hundreds of
+votes. SQLite uses a temporary file; PostgreSQL uses BENCHMARK_DATABASE_URL
+when set, otherwise an ephemeral testcontainers instance.
+
+Benchmarks are skipped unless pytest runs with --benchmark-only (see `just bench`).
+"""
+
+import importlib.util
+import itertools
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, get_db
+from app.main import app
+from app.models import Movie, MovieAvailability, Participant, Room, RoomMatch, Vote
+from app.services.vote_index import vote_index
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+CATALOG_SIZE = 10_000
+VOTES_PER_PARTICIPANT = 400
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def postgres_url():
+    """BENCHMARK_DATABASE_URL, or a throwaway PostgreSQL container."""
+    url = os.getenv("BENCHMARK_DATABASE_URL")
+    if url:
+        yield url
+        return
+    try:
+        from testcontainers.postgres import PostgresContainer
+
+        postgres = PostgresContainer("postgres:16-alpine", driver="psycopg")
+        postgres.start()
+    except Exception as e:
+        pytest.skip(f"PostgreSQL container unavailable: {e}")
+    try:
+        yield postgres.get_connection_url()
+    finally:
+        postgres.stop()
+
+
+def _seed(engine):
+    """Bulk-insert the synthetic catalog and benchmark rooms."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Movie),
+            [
+                {
+                    "tmdb_id": 100_000 + i,
+                    "title": f"Benchmark Movie {i}",
+                    "year": 1970 + i % 55,
+                    "genre": "Drama, Comedy",
+                    "poster_url": f"https://image.tmdb.org/t/p/w342/{i}.jpg",
+                    "description": "A synthetic movie for benchmarks.",
+                    "rating": 50 + i % 50,
+                }
+                for i in range(CATALOG_SIZE)
+            ],
+        )
+        movie_ids = sorted(
+            (row[0] for row in conn.execute(Movie.__table__.select().with_only_columns(Movie.id))),
+            reverse=True,
+        )
+
+        availability = [{"movie_id": m, "region": "US", "provider_id": 8} for m in movie_ids]
+        availability += [
+            {"movie_id": m, "region": "US", "provider_id": 337} for m in movie_ids[::2]
+        ]
+        availability += [{"movie_id": m, "region": "FR", "provider_id": 8} for m in movie_ids[::3]]
+        conn.execute(insert(MovieAvailability), availability)
+
+        rooms = {}
+        for code in ("MTCH", "VOTE"):
+            room_id = conn.execute(
+                insert(Room)
+                .values(code=code, region="US", provider_ids=[8, 337], is_active=True)
+                .returning(Room.id)
+            ).scalar_one()
+            participants = {}
+            for name in ("Alice", "Bob"):
+                participants[name] = conn.execute(
+                    insert(Participant)
+                    .values(room_id=room_id, name=name, session_id=f"{code}-{name}".lower())
+                    .returning(Participant.id)
+                ).scalar_one()
+            rooms[code] = {"id": room_id, "participants": participants}
+
+            # Votes on the front of the deck: Alice likes every 2nd movie, Bob every 3rd
+            voted = movie_ids[:VOTES_PER_PARTICIPANT]
+            conn.execute(
+                insert(Vote),
+                [
+                    {
+                        "room_id": room_id,
+                        "participant_id": participants[name],
+                        "movie_id": m,
+                        "liked": m % step == 0,
+                    }
+                    for name, step in (("Alice", 2), ("Bob", 3))
+                    for m in voted
+                ],
+            )
+            conn.execute(
+                insert(RoomMatch),
+                [{"room_id": room_id, "movie_id": m} for m in voted if m % 6 == 0],
+            )
+            rooms[code]["unvoted"] = movie_ids[VOTES_PER_PARTICIPANT:]
+    return rooms
+
+
+@pytest.fixture(scope="session", params=["sqlite", "postgres"])
+def dataset(request, tmp_path_factory):
+    """A seeded database for one backend: its sessionmaker and the benchmark rooms."""
+    if request.param == "sqlite":
+        path = tmp_path_factory.mktemp("benchmarks") / "cinematch.db"
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(request.getfixturevalue("postgres_url"))
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rooms = _seed(engine)
+    yield {"sessionmaker": sessionmaker(bind=engine), "rooms": rooms}
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def client(dataset):
+    """Test client bound to the benchmark database; the app lifespan is not started."""
+    session_factory = dataset["sessionmaker"]
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    vote_index.clear()
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    vote_index.clear()
+
+
+@pytest.fixture
+def fresh_movie_ids(dataset):
+    """Endless supply of movie ids for new votes in the VOTE room."""
+    return itertools.cycle(dataset["rooms"]["VOTE"]["unvoted"])
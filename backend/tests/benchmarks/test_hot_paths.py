@@ -0,0 +1,58 @@
+"""Benchmarks for the match and movie pool endpoints hit on every swipe."""
+
+
+def test_get_matches(benchmark, client):
+    benchmark.group = "get_matches"
+
+    response = benchmark(client.get, "/api/v1/votes/matches?code=MTCH")
+
+    assert response.status_code == 200
+    assert len(response.json()) > 0
+
+
+def test_get_movies(benchmark, client):
+    benchmark.group = "get_movies"
+
+    response = benchmark(client.get, "/api/v1/movies?code=MTCH")
+
+    assert response.status_code == 200
+    assert len(response.json()["movies"]) == 50
+
+
+def test_get_movies_deep_page(benchmark, client):
+    benchmark.group = "get_movies"
+    # 2000 movies deep
+    cursor = ""
+    for _ in range(20):
+        page = client.get("/api/v1/movies?code=MTCH&limit=100", params={"cursor": cursor})
+        cursor = page.json()["next_cursor"]
+
+    response = benchmark(client.get, "/api/v1/movies?code=MTCH", params={"cursor": cursor})
+
+    assert response.status_code == 200
+    assert len(response.json()["movies"]) == 50
+
+
+def test_get_unvoted_movies(benchmark, client, dataset):
+    benchmark.group = "get_unvoted_movies"
+    alice = dataset["rooms"]["MTCH"]["participants"]["Alice"]
+
+    response = benchmark(client.get, f"/api/v1/movies/unvoted?code=MTCH&participant_id={alice}")
+
+    assert response.status_code == 200
+    assert len(response.json()["movies"]) > 0
+
+
+def test_create_vote(benchmark, client, fresh_movie_ids):
+    benchmark.group = "create_vote"
+    client.cookies.set("session_id", "vote-alice")
+
+    def vote():
+        movie_id = next(fresh_movie_ids)
+        return client.post(
+            "/api/v1/votes?code=VOTE", json={"movie_id": movie_id, "liked": movie_id % 2 == 0}
+        )
+
+    response = benchmark(vote)
+
+    assert response.status_code == 200
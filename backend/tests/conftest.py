@@ -0,0 +1,38 @@
+"""Fixtures shared by the whole test suite."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.database import engine
+
+
+@pytest.fixture
+def query_budget():
+    """Fail when a block issues more SQL statements than its budget.
+
+    Usage::
+
+        with query_budget(3):
+            client.post(...)
+    """
+
+    @contextmanager
+    def budget(max_statements: int):
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) <= max_statements, (
+            f"{len(statements)} statements, budget is {max_statements}:\n" + "\n".join(statements)
+        )
+
+    return budget
@@ -0,0 +1,170 @@
+"""
+Query plan integration tests.
+
+The hot queries on votes, movie_availabilities and room_deck must be
+answerable from an index whatever the table sizes. Sequential scans are
+disabled so that the planner reports whether a usable index exists at all,
+rather than what it prefers on a small test dataset.
+
+Pattern: given [seeded database] when [hot query runs] then [index scans only]
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.orm import Session
+
+from app.models import Movie, MovieAvailability, Participant, Room, Vote
+from app.routers.movies import _ensure_movies_in_pool
+from app.services.deck import (
+    extend_room_deck,
+    next_deck_cards,
+    room_movies_page,
+    unvoted_movies,
+)
+from app.services.matches import sync_room_match
+from app.services.vote_index import vote_index
+
+INDEXED_TABLES = {"votes", "movie_availabilities", "room_deck"}
+
+# Enough regions and providers that a single one is a small slice of the availabilities
+REGIONS = ("US", "FR", "GB", "DE", "ES", "IT", "CA", "BR")
+PROVIDER_IDS = (8, 9, 337, 384, 350, 15)
+
+
+@pytest.fixture
+def seeded(db_session: Session):
+    """A few hundred movies on many providers and regions, and rooms full of votes."""
+    movie_ids = list(range(1, 501))
+    db_session.execute(
+        insert(Movie), [{"id": movie_id, "title": f"Movie {movie_id}"} for movie_id in movie_ids]
+    )
+    db_session.execute(
+        insert(MovieAvailability),
+        [
+            {"movie_id": movie_id, "region": region, "provider_id": provider_id}
+            for movie_id in movie_ids
+            for region in REGIONS
+            for provider_id in PROVIDER_IDS
+        ],
+    )
+
+    rooms = []
+    for number in range(10):
+        room = Room(code=f"{number:04d}", region="US", provider_ids=[8, 9])
+        room.participants = [
+            Participant(name=name, session_id=f"{number}-{name}") for name in ("Alice", "Bob")
+        ]
+        db_session.add(room)
+        db_session.flush()
+        db_session.execute(
+            insert(Vote),
+            [
+                {
+                    "room_id": room.id,
+                    "participant_id": participant.id,
+                    "movie_id": movie_id,
+                    "liked": movie_id % 3 == 0,
+                }
+                for participant in room.participants
+                for movie_id in movie_ids[:100]
+            ],
+        )
+        rooms.append(room)
+        extend_room_deck(db_session, room)
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    return rooms[0]
+
+
+def _leading_columns(db: Session) -> dict[str, tuple[str, str]]:
+    """Map each index name to its table and first key column."""
+    rows = db.execute(
+        text("""
+            SELECT i.relname, t.relname, a.attname
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = x.indkey[0]
+        """)
+    )
+    return {index: (table, column) for index, table, column in rows}
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _capture_selects(db: Session, run) -> list[tuple[str, dict]]:
+    statements: list[tuple[str, dict]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        run(db)
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+    return statements
+
+
+HOT_QUERIES = {
+    "room pool count (movies.py)": lambda db, room: _ensure_movies_in_pool(db, room, count=1),
+    "unvoted movies (movies.py)": lambda db, room: (
+        unvoted_movies(db, room, room.participants[0].id).limit(10).all()
+    ),
+    "room movies page (movies.py)": lambda db, room: room_movies_page(
+        db, room, limit=10, after_movie_id=250
+    ),
+    "deck cards": lambda db, room: next_deck_cards(
+        db, room, room.participants[0].id, after_position=50, limit=10
+    ),
+    "match check after a vote (votes.py)": lambda db, room: sync_room_match(db, room.id, 3),
+    "vote index rebuild": lambda db, room: vote_index._load(db, room.id),
+    "participant votes (movies.py)": lambda db, room: (
+        db.query(Vote.movie_id).filter(Vote.participant_id == room.participants[0].id).all()
+    ),
+}
+
+
+class TestHotQueryPlans:
+    """Test suite for index usage of the vote, availability and deck queries."""
+
+    @pytest.mark.parametrize("name", HOT_QUERIES)
+    def test_hot_query_uses_index_scans(self, db_session: Session, seeded, name):
+        """
+        given: seeded database with sequential scans disabled
+        when: the hot query is explained
+        then: these tables are only read through matching index conditions
+        """
+        # given
+        leading_columns = _leading_columns(db_session)
+        statements = _capture_selects(db_session, lambda db: HOT_QUERIES[name](db, seeded))
+        assert statements
+        db_session.execute(text("SET enable_seqscan = off"))
+
+        # when
+        plans = [
+            db_session.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            .scalar_one()[0]["Plan"]
+            for statement, parameters in statements
+        ]
+
+        # then - no sequential scans, no walks over a whole index, no heap rows filtered out
+        for plan in plans:
+            for node in _plan_nodes(plan):
+                table, leading = leading_columns.get(node.get("Index Name"), (None, None))
+                if (node.get("Relation Name") or table) not in INDEXED_TABLES:
+                    continue
+                assert node["Node Type"] != "Seq Scan", plan
+                if node["Node Type"] != "Index Only Scan":
+                    assert "Filter" not in node, plan
+                if leading is not None:
+                    assert re.search(rf"(?<![\w.]){leading}\b", node.get("Index Cond", "")), plan
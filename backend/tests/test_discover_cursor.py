@@ -0,0 +1,113 @@
+"""Tests for resuming TMDB discovery where the previous pool top-up stopped."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import DiscoverCursor, Movie
+from app.routers import movies
+from app.services import tmdb
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def discover(client, monkeypatch):
+    """Fake TMDB discovery of 20 new movies per page; records the requested pages."""
+    calls = {"pages": [], "total_pages": 5, "failing_pages": set()}
+
+    def fake_discover(db, region="US", provider_ids=None, page=1):
+        calls["pages"].append((region, tuple(provider_ids), page))
+        if page in calls["failing_pages"]:
+            raise RuntimeError("TMDB request failed")
+        results = [{"id": page * 100 + i, "title": f"Movie {page}.{i}"} for i in range(20)]
+        return {"page": page, "results": results, "total_pages": calls["total_pages"]}
+
+    monkeypatch.setattr(movies, "TMDB_API_KEY", "test-key")
+    monkeypatch.setattr(movies, "discover_movies", fake_discover)
+    # Top-ups are waited for, however slow the test machine
+    monkeypatch.setattr(movies, "POOL_FILL_DEADLINE_SECONDS", 10.0)
+    monkeypatch.setattr(movies.hydrator, "schedule", lambda: None)
+    monkeypatch.setattr(tmdb.genre_catalog, "names", lambda db, language="en-US": {})
+    return calls
+
+
+def create_room(client):
+    response = client.post("/api/v1/rooms", json={"region": "FR", "provider_ids": [337, 8]})
+    return response.json()["code"]
+
+
+def pages(discover):
+    return [page for _, _, page in discover["pages"]]
+
+
+def cursor():
+    with SessionLocal() as db:
+        row = db.query(DiscoverCursor).one()
+        return row.provider_key, row.last_page, row.total_pages
+
+
+class TestDiscoverCursor:
+    """Tests for the discover cursor of a region and set of providers."""
+
+    def test_first_top_up_starts_at_page_one(self, client, discover):
+        room_code = create_room(client)
+
+        response = client.get(f"/api/v1/movies?code={room_code}")
+
+        assert response.status_code == 200
+        assert pages(discover) == [1, 2, 3]
+        assert discover["pages"][0][:2] == ("FR", (8, 337))
+        assert cursor() == ("8,337", 3, 5)
+
+    def test_refresh_resumes_after_the_last_page(self, client, discover):
+        room_code = create_room(client)
+        client.get(f"/api/v1/movies?code={room_code}")
+        discover["pages"].clear()
+
+        client.get(f"/api/v1/movies?code={room_code}&refresh=true")
+
+        assert pages(discover) == [4, 5]
+        with SessionLocal() as db:
+            assert db.query(Movie).filter(Movie.tmdb_id.isnot(None)).count() == 100
+
+    def test_exhausted_catalog_is_not_requested_again(self, client, discover):
+        room_code = create_room(client)
+        client.get(f"/api/v1/movies?code={room_code}")
+        client.get(f"/api/v1/movies?code={room_code}&refresh=true")
+        discover["pages"].clear()
+
+        response = client.get(f"/api/v1/movies?code={room_code}&refresh=true")
+
+        assert response.status_code == 200
+        assert discover["pages"] == []
+        assert cursor() == ("8,337", 5, 5)
+
+    def test_other_rooms_on_the_same_providers_share_the_cursor(self, client, discover):
+        client.get(f"/api/v1/movies?code={create_room(client)}")
+        discover["pages"].clear()
+
+        client.get(f"/api/v1/movies?code={create_room(client)}&refresh=true")
+
+        assert pages(discover) == [4, 5]
+
+    def test_failed_page_is_retried_by_the_next_top_up(self, client, discover):
+        room_code = create_room(client)
+        discover["failing_pages"] = {2}
+        client.get(f"/api/v1/movies?code={room_code}")
+        assert pages(discover) == [1, 2]
+        discover["failing_pages"].clear()
+        discover["pages"].clear()
+
+        client.get(f"/api/v1/movies?code={room_code}")
+
+        assert pages(discover) == [2, 3]
+        assert cursor() == ("8,337", 3, 5)
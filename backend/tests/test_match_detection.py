@@ -4,7 +4,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine
+from app.models import Vote
 
 
 @pytest.fixture
@@ -203,3 +204,99 @@ class TestMatchDetection:
 
         matches = response.json()
         assert len(matches) == 0, f"Expected 0 matches with single participant but got {len(matches)}"
+
+    def test_vote_response_flags_the_deciding_vote(
+        self, client, setup_room_with_two_users
+    ):
+        """
+        The vote that completes a match should say so, so the voter
+        does not need a second request to learn about it.
+        """
+        data = setup_room_with_two_users
+        room_code = data["room_code"]
+        movies = data["movies"]
+
+        if not movies:
+            pytest.skip("No movies available in database")
+
+        movie = movies[0]
+
+        # Alice likes first - no match yet
+        response = client.post(
+            f"/api/v1/votes?code={room_code}",
+            json={"movie_id": movie["id"], "liked": True},
+            cookies={"session_id": "alice-session"}
+        )
+        assert response.json()["matched"] is False
+
+        # Bob likes the same movie - this completes the match
+        response = client.post(
+            f"/api/v1/votes?code={room_code}",
+            json={"movie_id": movie["id"], "liked": True},
+            cookies={"session_id": "bob-session"}
+        )
+        assert response.json()["matched"] is True
+
+    def test_match_removed_when_vote_flips_to_dislike(
+        self, client, setup_room_with_two_users
+    ):
+        """
+        When a participant changes their like to a dislike,
+        the movie should no longer be listed as a match.
+        """
+        data = setup_room_with_two_users
+        room_code = data["room_code"]
+        movies = data["movies"]
+
+        if not movies:
+            pytest.skip("No movies available in database")
+
+        movie = movies[0]
+
+        # Both like the movie
+        for session_id in ("alice-session", "bob-session"):
+            client.post(
+                f"/api/v1/votes?code={room_code}",
+                json={"movie_id": movie["id"], "liked": True},
+                cookies={"session_id": session_id}
+            )
+        response = client.get(f"/api/v1/votes/matches?code={room_code}")
+        assert len(response.json()) == 1
+
+        # Bob changes their mind
+        response = client.post(
+            f"/api/v1/votes?code={room_code}",
+            json={"movie_id": movie["id"], "liked": False},
+            cookies={"session_id": "bob-session"}
+        )
+        assert response.json()["matched"] is False
+
+        response = client.get(f"/api/v1/votes/matches?code={room_code}")
+        assert response.json() == []
+
+    def test_repeated_vote_updates_the_same_row(self, client, setup_room_with_two_users):
+        """A double-tap or a changed mind never stores a second vote."""
+        data = setup_room_with_two_users
+        room_code = data["room_code"]
+        movies = data["movies"]
+
+        if not movies:
+            pytest.skip("No movies available in database")
+
+        ids = set()
+        for liked in (True, True, False):
+            response = client.post(
+                f"/api/v1/votes?code={room_code}",
+                json={"movie_id": movies[0]["id"], "liked": liked},
+                cookies={"session_id": "alice-session"}
+            )
+            assert response.json()["liked"] is liked
+            ids.add(response.json()["id"])
+        assert len(ids) == 1
+
+        db = SessionLocal()
+        try:
+            votes = db.query(Vote).filter(Vote.participant_id == data["alice_id"]).all()
+            assert [(v.movie_id, v.liked) for v in votes] == [(movies[0]["id"], False)]
+        finally:
+            db.close()
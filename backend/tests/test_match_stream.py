@@ -0,0 +1,178 @@
+"""Tests for the Server-Sent Events match stream."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+from app.routers.votes import _match_events
+from app.services.events import broker
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_data = response.json()
+
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_data['code']}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+
+    response = client.get(f"/api/v1/movies?code={room_data['code']}")
+    movies = response.json()["movies"]
+    if len(movies) < 2:
+        pytest.skip("Need at least 2 movies for this test")
+
+    return {"id": room_data["id"], "code": room_data["code"], "movies": movies}
+
+
+class ConnectedRequest:
+    """Stand-in for a client that never disconnects."""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+def like(client, room_code, movie_id):
+    """Both participants like the movie."""
+    for session_id in ("alice-session", "bob-session"):
+        client.post(
+            f"/api/v1/votes?code={room_code}",
+            json={"movie_id": movie_id, "liked": True},
+            cookies={"session_id": session_id},
+        )
+
+
+def parse_frame(frame: str) -> dict[str, str]:
+    """Split an SSE frame into its fields."""
+    fields = {}
+    for line in frame.strip().split("\n"):
+        key, _, value = line.partition(": ")
+        fields[key] = value
+    return fields
+
+
+class TestMatchStream:
+    """Tests for pushing matches over SSE."""
+
+    def test_stream_unknown_room_returns_404(self, client):
+        response = client.get("/api/v1/votes/matches/stream?code=0000")
+        assert response.status_code == 404
+
+    def test_stream_replays_existing_matches(self, client, room):
+        """
+        On first connect, matches recorded before the stream opened
+        are sent so the client starts with the full list.
+        """
+        movie = room["movies"][0]
+        like(client, room["code"], movie["id"])
+
+        async def first_frame():
+            events = _match_events(ConnectedRequest(), room["id"], 0)
+            try:
+                return await events.__anext__()
+            finally:
+                await events.aclose()
+
+        frame = asyncio.run(first_frame())
+
+        fields = parse_frame(frame)
+        assert fields["event"] == "match"
+        assert json.loads(fields["data"])["movie"]["title"] == movie["title"]
+
+    def test_stream_resumes_after_last_event_id_and_pushes_new_match(self, client, room):
+        """
+        Reconnecting with the last seen id skips already delivered matches,
+        and a match recorded while connected is pushed immediately.
+        """
+        first, second = room["movies"][0], room["movies"][1]
+        like(client, room["code"], first["id"])
+
+        async def resume_and_wait():
+            replay = _match_events(ConnectedRequest(), room["id"], 0)
+            seen_id = int(parse_frame(await replay.__anext__())["id"])
+            await replay.aclose()
+
+            events = _match_events(ConnectedRequest(), room["id"], seen_id)
+            pending = asyncio.ensure_future(events.__anext__())
+            # Let the stream subscribe and finish its (empty) replay
+            await asyncio.sleep(0.2)
+            assert not pending.done()
+
+            await asyncio.to_thread(like, client, room["code"], second["id"])
+            frame = await asyncio.wait_for(pending, timeout=5)
+            await events.aclose()
+            return seen_id, frame
+
+        seen_id, frame = asyncio.run(resume_and_wait())
+
+        fields = parse_frame(frame)
+        assert int(fields["id"]) > seen_id
+        assert json.loads(fields["data"])["movie"]["id"] == second["id"]
+
+    def test_stream_pushes_unmatch_when_a_vote_is_changed(self, client, room):
+        """
+        A participant who changes their like on a matched movie undoes the
+        match, and subscribers are told to drop it.
+        """
+        movie = room["movies"][0]
+        like(client, room["code"], movie["id"])
+
+        async def replay_and_wait():
+            events = _match_events(ConnectedRequest(), room["id"], 0)
+            await events.__anext__()
+            pending = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.2)
+
+            await asyncio.to_thread(
+                client.post,
+                f"/api/v1/votes?code={room['code']}",
+                json={"movie_id": movie["id"], "liked": False},
+                cookies={"session_id": "bob-session"},
+            )
+            frame = await asyncio.wait_for(pending, timeout=5)
+            await events.aclose()
+            return frame
+
+        fields = parse_frame(asyncio.run(replay_and_wait()))
+
+        assert fields["event"] == "unmatch"
+        assert "id" not in fields
+        assert json.loads(fields["data"]) == {"movie_id": movie["id"]}
+
+    def test_stream_pushes_pool_updates(self, client, room):
+        """
+        A pool top-up that added movies to the room is relayed, so that
+        subscribers fetch them.
+        """
+
+        async def wait_for_top_up():
+            events = _match_events(ConnectedRequest(), room["id"], 0)
+            pending = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.2)
+
+            broker.publish(room["id"], {"type": "pool_updated"})
+            frame = await asyncio.wait_for(pending, timeout=5)
+            await events.aclose()
+            return frame
+
+        fields = parse_frame(asyncio.run(wait_for_top_up()))
+
+        assert fields["event"] == "pool_updated"
+        assert "id" not in fields
@@ -0,0 +1,113 @@
+"""Tests for filling in TMDB details of movies stored from discover results."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Movie
+from app.services import tmdb
+from app.services.hydration import MovieHydrator
+
+
+@pytest.fixture
+def detail_requests(monkeypatch):
+    """Fake TMDB detail requests; movie 13 always fails. Records the requested ids."""
+    requested = []
+
+    def fake_request(endpoint, params=None, client=None):
+        tmdb_id = int(endpoint.split("/")[2])
+        requested.append(tmdb_id)
+        if tmdb_id == 13:
+            raise RuntimeError("TMDB request failed")
+        return {
+            "genres": [{"name": "Drama"}, {"name": "Crime"}],
+            "videos": {"results": [{"type": "Trailer", "site": "YouTube", "key": f"yt{tmdb_id}"}]},
+            "backdrop_path": f"/backdrop{tmdb_id}.jpg",
+            "vote_average": 8.7,
+        }
+
+    monkeypatch.setattr(tmdb, "_make_request", fake_request)
+    return requested
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+def store(*movies):
+    """Store movies as the discover ingest does and return their ids."""
+    with SessionLocal() as db:
+        rows = [Movie(**movie) for movie in movies]
+        db.add_all(rows)
+        db.commit()
+        return [row.id for row in rows]
+
+
+class TestMovieHydrator:
+    """Tests for the background hydration worker."""
+
+    def test_hydrates_movies_stored_from_discover_results(self, client, detail_requests):
+        movie_id, static_id = store(
+            {"tmdb_id": 12, "title": "Discovered", "genre": "18, 80"},
+            {"title": "Static"},
+        )
+
+        assert MovieHydrator().drain() == 1
+
+        with SessionLocal() as db:
+            movie = db.get(Movie, movie_id)
+            assert movie.genre == "Drama, Crime"
+            assert movie.trailer_key == "yt12"
+            assert movie.backdrop_url.endswith("/w780/backdrop12.jpg")
+            assert movie.rating == 87
+            assert movie.hydrated_at is not None
+            assert db.get(Movie, static_id).hydrated_at is None
+        assert detail_requests == [12]
+
+    def test_failed_fetch_is_retried_on_the_next_drain(self, client, detail_requests):
+        (movie_id,) = store({"tmdb_id": 13, "title": "Unlucky"})
+        hydrator = MovieHydrator()
+
+        assert hydrator.drain() == 0
+        assert hydrator.drain() == 0
+
+        assert detail_requests == [13, 13]
+        with SessionLocal() as db:
+            assert db.get(Movie, movie_id).hydrated_at is None
+
+    def test_hydrated_movies_are_not_fetched_again(self, client, detail_requests):
+        store({"tmdb_id": 12, "title": "Discovered"})
+        hydrator = MovieHydrator()
+        hydrator.drain()
+        detail_requests.clear()
+
+        assert hydrator.drain() == 0
+        assert detail_requests == []
+
+
+class TestMovieDetailHydration:
+    """Tests for hydrating a movie on demand in GET /api/v1/movies/{id}."""
+
+    def test_unhydrated_movie_is_hydrated_on_first_view(self, client, detail_requests):
+        (movie_id,) = store({"tmdb_id": 12, "title": "Discovered"})
+
+        first = client.get(f"/api/v1/movies/{movie_id}")
+        second = client.get(f"/api/v1/movies/{movie_id}")
+
+        assert first.json()["trailer_key"] == "yt12"
+        assert second.json() == first.json()
+        assert detail_requests == [12]
+
+    def test_failed_fetch_returns_the_discover_data(self, client, detail_requests):
+        (movie_id,) = store({"tmdb_id": 13, "title": "Unlucky", "genre": "18"})
+
+        response = client.get(f"/api/v1/movies/{movie_id}")
+
+        assert response.status_code == 200
+        assert response.json()["genre"] == "18"
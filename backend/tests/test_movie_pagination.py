@@ -0,0 +1,102 @@
+"""Tests for cursor pagination of a room's movies."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+from app.services.deck import encode_cursor
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    response = client.get(f"/api/v1/movies?code={room_code}&limit=100")
+    movie_ids = [m["id"] for m in response.json()["movies"]]
+    if len(movie_ids) < 12:
+        pytest.skip("Not enough movies available")
+    return {"code": room_code, "movie_ids": movie_ids}
+
+
+def get_page(client, room, limit, cursor=None):
+    params = {"code": room["code"], "limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    return client.get("/api/v1/movies", params=params)
+
+
+class TestMoviePagination:
+    """Tests for next_cursor on GET /api/v1/movies."""
+
+    def test_pages_cover_the_pool_exactly_once(self, client, room):
+        seen, cursor = [], None
+        while True:
+            data = get_page(client, room, 5, cursor).json()
+            seen += [m["id"] for m in data["movies"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == room["movie_ids"]
+
+    def test_votes_between_pages_do_not_skip_cards(self, client, room):
+        movie_ids = room["movie_ids"]
+        first = get_page(client, room, 5).json()
+
+        # Vote on movies from both the page already seen and the next one
+        for movie_id in (movie_ids[0], movie_ids[6]):
+            client.post(
+                f"/api/v1/votes?code={room['code']}",
+                json={"movie_id": movie_id, "liked": False},
+                cookies={"session_id": "alice-session"},
+            )
+
+        second = get_page(client, room, 5, first["next_cursor"]).json()
+
+        assert [m["id"] for m in second["movies"]] == movie_ids[5:6] + movie_ids[7:11]
+
+    def test_deep_page_costs_the_same_as_the_first(self, client, room, query_budget):
+        cursors = []
+        data = get_page(client, room, 2).json()
+        while data["next_cursor"]:
+            cursors.append(data["next_cursor"])
+            data = get_page(client, room, 2, data["next_cursor"]).json()
+
+        with query_budget(100) as first_page:
+            get_page(client, room, 2)
+        with query_budget(len(first_page)) as last_page:
+            response = get_page(client, room, 2, cursors[-1])
+
+        assert response.status_code == 200
+        # Keyset on the deck position rather than an offset into the pool
+        assert any("room_deck.position >" in statement for statement in last_page)
+
+    def test_invalid_cursor_is_rejected(self, client, room):
+        response = get_page(client, room, 5, cursor="not-a-cursor")
+
+        assert response.status_code == 400
+
+    def test_cursor_outside_the_rooms_deck_is_rejected(self, client, room):
+        # Restarting from the first page would repeat cards
+        cursor = encode_cursor(max(room["movie_ids"]) + 1000)
+
+        response = get_page(client, room, 5, cursor=cursor)
+
+        assert response.status_code == 400
@@ -4,7 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine
+from app.models import Movie, MovieAvailability
+from app.routers.movies import _record_availabilities
 
 
 @pytest.fixture
@@ -102,3 +104,31 @@ class TestMultiProviderSelection:
 
         room_data = room_resp.json()
         assert room_data["provider_ids"] == [8]  # Netflix default
+
+    def test_availability_for_new_providers_is_recorded_in_bulk(self, client, query_budget):
+        """
+        Recording availability for a page of movies on several providers
+        should be a single statement, and recording it again a no-op.
+        """
+        room_resp = client.post("/api/v1/rooms")
+        client.get(f"/api/v1/movies?code={room_resp.json()['code']}")
+
+        db = SessionLocal()
+        try:
+            movie_ids = [movie_id for (movie_id,) in db.query(Movie.id).limit(20)]
+            for _ in range(2):
+                with query_budget(1):
+                    _record_availabilities(db, movie_ids, "US", [8, 337, 384])
+
+            recorded = (
+                db.query(MovieAvailability)
+                .filter(
+                    MovieAvailability.region == "US",
+                    MovieAvailability.provider_id.in_([8, 337, 384]),
+                    MovieAvailability.movie_id.in_(movie_ids),
+                )
+                .count()
+            )
+        finally:
+            db.close()
+        assert recorded == 3 * len(movie_ids)
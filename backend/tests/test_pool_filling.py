@@ -0,0 +1,147 @@
+"""Tests for answering within a deadline while the pool fills from TMDB."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Room
+from app.routers import movies
+from app.services import tmdb
+from app.services.room_version import room_etag
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def discover(client, monkeypatch):
+    """Fake TMDB discovery that hangs until released; records the requested pages.
+
+    Set ``calls["error"]`` to make released requests fail.
+    """
+    calls = {"pages": [], "release": threading.Event(), "error": None}
+
+    def fake_discover(db, region="US", provider_ids=None, page=1):
+        calls["pages"].append(page)
+        calls["release"].wait(timeout=10)
+        if calls["error"]:
+            raise calls["error"]
+        results = [{"id": page * 100 + i, "title": f"Movie {page}.{i}"} for i in range(20)]
+        return {"page": page, "results": results, "total_pages": 3}
+
+    monkeypatch.setattr(movies, "TMDB_API_KEY", "test-key")
+    monkeypatch.setattr(movies, "POOL_FILL_DEADLINE_SECONDS", 0.05)
+    monkeypatch.setattr(movies, "discover_movies", fake_discover)
+    monkeypatch.setattr(movies.hydrator, "schedule", lambda: None)
+    monkeypatch.setattr(tmdb.genre_catalog, "names", lambda db, language="en-US": {})
+    yield calls
+    calls["release"].set()
+    wait_for_top_ups()
+
+
+def wait_for_top_ups():
+    with movies._pool_fills_lock:
+        fills = list(movies._pool_fills.values())
+    for fill in fills:
+        fill.result(timeout=10)
+
+
+def current_etag(room_code):
+    """The ETag of the room's first movies page at its current version."""
+    with SessionLocal() as db:
+        room = db.query(Room).filter(Room.code == room_code).one()
+        return room_etag(room, "movies", "", 50)
+
+
+@pytest.fixture
+def room_code(client):
+    # Outside the static catalog seeded at startup
+    response = client.post("/api/v1/rooms", json={"region": "FR", "provider_ids": [337]})
+    return response.json()["code"]
+
+
+class TestPoolFillDeadline:
+    """Tests for the pool top-up deadline of GET /api/v1/movies and /unvoted."""
+
+    def test_slow_top_up_answers_with_what_is_available(self, client, discover, room_code):
+        response = client.get(f"/api/v1/movies?code={room_code}")
+
+        assert response.status_code == 200
+        assert response.json()["movies"] == []
+        assert response.json()["pool_filling"] is True
+
+    def test_top_up_completes_in_the_background(self, client, discover, room_code):
+        client.get(f"/api/v1/movies?code={room_code}")
+        etag = current_etag(room_code)
+
+        discover["release"].set()
+        wait_for_top_ups()
+        second = client.get(f"/api/v1/movies?code={room_code}", headers={"If-None-Match": etag})
+
+        assert second.status_code == 200
+        assert len(second.json()["movies"]) == 50
+        assert second.json()["pool_filling"] is False
+        assert discover["pages"] == [1, 2, 3]
+
+    def test_completed_top_up_is_published_to_the_room(
+        self, client, discover, room_code, monkeypatch
+    ):
+        published = []
+        monkeypatch.setattr(
+            movies.broker, "publish", lambda room_id, event: published.append(event)
+        )
+        client.get(f"/api/v1/movies?code={room_code}")
+        assert published == []
+
+        discover["release"].set()
+        wait_for_top_ups()
+
+        assert published == [{"type": "pool_updated"}]
+
+    def test_failed_top_up_is_retried_by_the_next_request(self, client, discover, room_code):
+        first = client.get(f"/api/v1/movies?code={room_code}")
+        etag = current_etag(room_code)
+
+        discover["error"] = RuntimeError("TMDB unavailable")
+        discover["release"].set()
+        wait_for_top_ups()
+        second = client.get(f"/api/v1/movies?code={room_code}", headers={"If-None-Match": etag})
+
+        # A filling pool is not cached, and a failed top-up still moves the version on
+        assert "etag" not in first.headers
+        assert second.status_code == 200
+        assert discover["pages"] == [1, 1]
+
+    def test_requests_during_a_top_up_share_it(self, client, discover, room_code):
+        client.get(f"/api/v1/movies?code={room_code}")
+        client.get(f"/api/v1/movies?code={room_code}&refresh=true")
+
+        assert discover["pages"] == [1]
+
+    def test_fast_top_up_is_waited_for(self, client, discover, room_code, monkeypatch):
+        monkeypatch.setattr(movies, "POOL_FILL_DEADLINE_SECONDS", 5.0)
+        discover["release"].set()
+
+        response = client.get(f"/api/v1/movies?code={room_code}")
+
+        assert len(response.json()["movies"]) == 50
+        assert response.json()["pool_filling"] is False
+
+    def test_unvoted_movies_report_a_slow_top_up(self, client, discover, room_code):
+        response = client.post(f"/api/v1/rooms/{room_code}/join", json={"name": "Alice"})
+        participant_id = response.json()["id"]
+
+        response = client.get(
+            f"/api/v1/movies/unvoted?code={room_code}&participant_id={participant_id}"
+        )
+
+        assert response.json() == {"movies": [], "next_cursor": None, "pool_filling": True}
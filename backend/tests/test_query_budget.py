@@ -0,0 +1,90 @@
+"""Tests for per-request SQL instrumentation and statement budgets of hot endpoints."""
+
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants, a seeded movie pool and a warm vote index."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    response = client.get(f"/api/v1/movies?code={room_code}")
+    movies = response.json()["movies"]
+    if len(movies) < 3:
+        pytest.skip("Not enough movies available")
+
+    client.post(
+        f"/api/v1/votes?code={room_code}",
+        json={"movie_id": movies[0]["id"], "liked": False},
+        cookies={"session_id": "alice-session"},
+    )
+    return {"code": room_code, "movies": movies}
+
+
+class TestServerTiming:
+    """Tests for the Server-Timing header."""
+
+    def test_reports_statements_and_database_time(self, client, room):
+        response = client.get(f"/api/v1/votes/matches?code={room['code']}")
+
+        timing = response.headers["Server-Timing"]
+        match = re.match(r'db;dur=([\d.]+);desc="(\d+) statements?", app;dur=([\d.]+)', timing)
+        assert match is not None, timing
+        db_ms, statements, total_ms = match.groups()
+        assert int(statements) >= 1
+        assert float(db_ms) <= float(total_ms)
+
+    def test_request_without_queries(self, client):
+        response = client.get("/health")
+
+        assert response.headers["Server-Timing"].startswith('db;dur=0.00;desc="0 statements"')
+
+
+class TestQueryBudget:
+    """Statement budgets for the endpoints hit on every swipe."""
+
+    def test_create_vote(self, client, room, query_budget):
+        # Includes the pg_notify that publishes the vote on PostgreSQL
+        with query_budget(5):
+            response = client.post(
+                f"/api/v1/votes?code={room['code']}",
+                json={"movie_id": room["movies"][1]["id"], "liked": True},
+                cookies={"session_id": "alice-session"},
+            )
+        assert response.status_code == 200
+
+    def test_get_matches(self, client, room, query_budget):
+        with query_budget(3):
+            response = client.get(f"/api/v1/votes/matches?code={room['code']}")
+        assert response.status_code == 200
+
+    def test_get_room(self, client, room, query_budget):
+        with query_budget(1):
+            response = client.get(f"/api/v1/rooms/{room['code']}")
+        assert response.status_code == 200
+
+    def test_budget_overrun_fails(self, client, room, query_budget):
+        with pytest.raises(AssertionError, match="statements, budget is 0"):
+            with query_budget(0):
+                client.get(f"/api/v1/rooms/{room['code']}")
@@ -0,0 +1,133 @@
+"""Tests for the WebSocket room channel."""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+
+    ids = {}
+    for name in ("Alice", "Bob"):
+        response = client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+        ids[name] = response.json()["id"]
+
+    response = client.get(f"/api/v1/movies?code={room_code}")
+    movies = response.json()["movies"]
+    if not movies:
+        pytest.skip("No movies available")
+
+    return {"code": room_code, "ids": ids, "movies": movies}
+
+
+def connect(client, room_code, session_id):
+    return client.websocket_connect(
+        f"/ws/rooms/{room_code}", headers={"cookie": f"session_id={session_id}"}
+    )
+
+
+def receive_until(websocket, *event_types):
+    """Collect frames until one of each given type has arrived, in any order."""
+    received = {}
+    while set(event_types) - set(received):
+        message = websocket.receive_json()
+        received.setdefault(message["type"], message)
+    if len(event_types) == 1:
+        return received[event_types[0]]
+    return received
+
+
+class TestRoomChannel:
+    """Tests for live room events over WebSocket."""
+
+    def test_non_participant_is_rejected(self, client, room):
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with connect(client, room["code"], "stranger-session") as websocket:
+                websocket.receive_json()
+
+        assert exc_info.value.code == 1008
+
+    def test_connect_sends_room_state(self, client, room):
+        with connect(client, room["code"], "alice-session") as websocket:
+            state = websocket.receive_json()
+
+        assert state["type"] == "room_state"
+        assert {p["name"] for p in state["participants"]} == {"Alice", "Bob"}
+        assert all(p["vote_count"] == 0 for p in state["participants"])
+
+    def test_votes_over_socket_reach_partner_and_match(self, client, room):
+        """
+        A vote sent on the socket is recorded, the partner sees the
+        new vote count, and a completed match is pushed to both.
+        """
+        movie_id = room["movies"][0]["id"]
+
+        with connect(client, room["code"], "alice-session") as alice:
+            alice.receive_json()  # room_state
+            with connect(client, room["code"], "bob-session") as bob:
+                bob.receive_json()  # room_state
+
+                alice.send_json({"type": "vote", "movie_id": movie_id, "liked": True})
+                result = receive_until(alice, "vote_result")
+                assert result["matched"] is False
+
+                progress = receive_until(bob, "votes")
+                assert progress == {
+                    "type": "votes",
+                    "participant_id": room["ids"]["Alice"],
+                    "count": 1,
+                }
+
+                bob.send_json({"type": "vote", "movie_id": movie_id, "liked": True})
+                frames = receive_until(bob, "vote_result", "match")
+                assert frames["vote_result"]["matched"] is True
+                assert frames["match"]["movie"]["id"] == movie_id
+                assert receive_until(alice, "match")["movie"]["id"] == movie_id
+
+    def test_invalid_frame_returns_error(self, client, room):
+        with connect(client, room["code"], "alice-session") as websocket:
+            websocket.receive_json()  # room_state
+            websocket.send_json({"type": "vote", "liked": True})
+
+            assert websocket.receive_json()["type"] == "error"
+
+    def test_join_is_broadcast(self, client):
+        response = client.post("/api/v1/rooms")
+        room_code = response.json()["code"]
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": "Alice"},
+            cookies={"session_id": "alice-session"},
+        )
+
+        with connect(client, room_code, "alice-session") as websocket:
+            websocket.receive_json()  # room_state
+            client.post(
+                f"/api/v1/rooms/{room_code}/join",
+                json={"name": "Bob"},
+                cookies={"session_id": "bob-session"},
+            )
+
+            joined = receive_until(websocket, "participant_joined")
+
+        assert joined["participant"]["name"] == "Bob"
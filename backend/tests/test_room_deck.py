@@ -0,0 +1,140 @@
+"""Tests for the per-room swipe deck and the participants' cursors in it."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Movie, MovieAvailability, Room, RoomDeckCard
+from app.services.deck import extend_room_deck
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+def create_room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    client.get(f"/api/v1/movies?code={room_code}")
+    return room_code
+
+
+def deck(room_code):
+    db = SessionLocal()
+    try:
+        return [
+            movie_id
+            for (movie_id,) in db.query(RoomDeckCard.movie_id)
+            .join(Room, Room.id == RoomDeckCard.room_id)
+            .filter(Room.code == room_code)
+            .order_by(RoomDeckCard.position)
+        ]
+    finally:
+        db.close()
+
+
+def top_up(room_code, count):
+    """Add newer movies to the room's pool and deck, as a TMDB top-up does."""
+    db = SessionLocal()
+    try:
+        movies = [Movie(title=f"New movie {number}") for number in range(count)]
+        db.add_all(movies)
+        db.flush()
+        db.add_all(MovieAvailability(movie_id=m.id, region="US", provider_id=8) for m in movies)
+        db.commit()
+        extend_room_deck(db, db.query(Room).filter(Room.code == room_code).one())
+    finally:
+        db.close()
+
+
+def swipe(client, room_code, session_id, movie_id, **params):
+    response = client.post(
+        f"/api/v1/rooms/{room_code}/swipe",
+        params=params,
+        json={"movie_id": movie_id, "liked": True},
+        cookies={"session_id": session_id},
+    )
+    return [m["id"] for m in response.json()["next_movies"]]
+
+
+@pytest.fixture
+def room_code(client):
+    room_code = create_room(client)
+    if len(deck(room_code)) < 10:
+        pytest.skip("Not enough movies available")
+    return room_code
+
+
+class TestRoomDeck:
+    """Tests for dealing cards from the room deck."""
+
+    def test_pool_top_up_fills_the_deck_in_pool_order(self, client, room_code):
+        response = client.get(f"/api/v1/movies?code={room_code}&limit=100")
+
+        assert deck(room_code) == [m["id"] for m in response.json()["movies"]]
+
+    def test_new_room_is_dealt_the_known_pool(self, client, room_code):
+        response = client.post("/api/v1/rooms")
+
+        assert deck(response.json()["code"]) == deck(room_code)
+
+    def test_partners_are_dealt_the_same_order(self, client, room_code):
+        cards = deck(room_code)
+
+        alice = swipe(client, room_code, "alice-session", cards[0], limit=4)
+        bob = swipe(client, room_code, "bob-session", cards[0], limit=4)
+
+        assert alice == bob == cards[1:5]
+
+    def test_cursor_follows_the_last_swiped_card(self, client, room_code):
+        cards = deck(room_code)
+        swipe(client, room_code, "alice-session", cards[0])
+        swipe(client, room_code, "alice-session", cards[3])
+
+        # A late swipe on an earlier card does not move the cursor back
+        assert swipe(client, room_code, "alice-session", cards[1], limit=2) == cards[4:6]
+
+    def test_deals_after_the_cards_the_client_holds(self, client, room_code):
+        cards = deck(room_code)
+
+        assert (
+            swipe(client, room_code, "alice-session", cards[0], limit=2, after=cards[5])
+            == (cards[6:8])
+        )
+
+    def test_empty_deck_is_filled_on_the_next_swipe(self, client, room_code):
+        cards = deck(room_code)
+        db = SessionLocal()
+        db.query(RoomDeckCard).delete()
+        db.commit()
+        db.close()
+
+        assert swipe(client, room_code, "alice-session", cards[0], limit=3) == cards[1:4]
+        assert deck(room_code) == cards
+
+    def test_listing_and_swiping_deal_a_topped_up_pool_to_the_end(self, client, room_code):
+        top_up(room_code, 5)
+        cards = deck(room_code)
+
+        # The page's client: list a first page, then swipe and deal behind its last card
+        response = client.get(f"/api/v1/movies?code={room_code}&limit=5")
+        held = [m["id"] for m in response.json()["movies"]]
+        swiped = 0
+        while swiped < len(held):
+            held += swipe(client, room_code, "alice-session", held[swiped], after=held[-1], limit=1)
+            swiped += 1
+
+        assert held == cards
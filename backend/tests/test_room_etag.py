@@ -0,0 +1,112 @@
+"""Tests for room version ETags and 304 Not Modified on room reads."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room_code(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    client.get(f"/api/v1/movies?code={room_code}")
+    return room_code
+
+
+def revalidate(client, url):
+    """Fetch a URL, then fetch it again with the ETag it returned."""
+    first = client.get(url)
+    second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    return first, second
+
+
+class TestRoomEtag:
+    """Tests that unchanged room reads short-circuit to 304."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/rooms/{code}",
+            "/api/v1/votes/matches?code={code}",
+            "/api/v1/movies?code={code}",
+        ],
+    )
+    def test_unchanged_room_returns_304(self, client, room_code, path):
+        first, second = revalidate(client, path.format(code=room_code))
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.content == b""
+
+    def test_vote_invalidates_etags(self, client, room_code):
+        movies = client.get(f"/api/v1/movies?code={room_code}")
+        matches = client.get(f"/api/v1/votes/matches?code={room_code}")
+        movie_id = movies.json()["movies"][0]["id"]
+
+        client.post(
+            f"/api/v1/votes?code={room_code}",
+            json={"movie_id": movie_id, "liked": True},
+            cookies={"session_id": "alice-session"},
+        )
+
+        response = client.get(
+            f"/api/v1/movies?code={room_code}",
+            headers={"If-None-Match": movies.headers["ETag"]},
+        )
+        assert response.status_code == 200
+        assert movie_id not in [m["id"] for m in response.json()["movies"]]
+
+        response = client.get(
+            f"/api/v1/votes/matches?code={room_code}",
+            headers={"If-None-Match": matches.headers["ETag"]},
+        )
+        assert response.status_code == 200
+
+    def test_join_invalidates_room_etag(self, client):
+        response = client.post("/api/v1/rooms")
+        room_code = response.json()["code"]
+        room = client.get(f"/api/v1/rooms/{room_code}")
+
+        client.post(f"/api/v1/rooms/{room_code}/join", json={"name": "Alice"})
+
+        response = client.get(
+            f"/api/v1/rooms/{room_code}", headers={"If-None-Match": room.headers["ETag"]}
+        )
+        assert response.status_code == 200
+
+    def test_etag_is_specific_to_the_page(self, client, room_code):
+        first_page = client.get(f"/api/v1/movies?code={room_code}&limit=5")
+
+        response = client.get(
+            f"/api/v1/movies?code={room_code}&limit=5&cursor={first_page.json()['next_cursor']}",
+            headers={"If-None-Match": first_page.headers["ETag"]},
+        )
+        assert response.status_code == 200
+
+    def test_refresh_bypasses_etag(self, client, room_code):
+        movies = client.get(f"/api/v1/movies?code={room_code}")
+
+        response = client.get(
+            f"/api/v1/movies?code={room_code}&refresh=true",
+            headers={"If-None-Match": movies.headers["ETag"]},
+        )
+        assert response.status_code == 200
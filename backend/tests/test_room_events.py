@@ -0,0 +1,49 @@
+"""Tests for the room event broker and its PostgreSQL listener."""
+
+import asyncio
+import json
+import time
+
+from app.database import engine
+from app.services.events import PostgresListener, RoomEventBroker
+
+
+def test_broker_delivers_in_memory_without_listener():
+    """Without PostgreSQL, published events reach local subscribers directly."""
+    broker = RoomEventBroker()
+
+    async def publish_and_receive():
+        subscription = broker.subscribe(room_id=1)
+        broker.publish(1, {"type": "match", "id": 7})
+        broker.publish(2, {"type": "match", "id": 8})  # other room
+        first = await subscription.get(timeout=1)
+        second = await subscription.get(timeout=0.1)
+        broker.unsubscribe(subscription)
+        return first, second
+
+    first, second = asyncio.run(publish_and_receive())
+
+    assert first == {"type": "match", "id": 7}
+    assert second is None
+    assert broker.stats() == {"transport": "memory"}
+
+
+def test_listener_dispatches_notifications_and_records_lag():
+    """A notification is unwrapped, dispatched to the room, and its lag measured."""
+    broker = RoomEventBroker()
+    listener = PostgresListener(engine, broker)
+
+    async def notify_and_receive():
+        subscription = broker.subscribe(room_id=3)
+        payload = {"room_id": 3, "event": {"type": "votes"}, "sent_at": time.time() - 0.05}
+        listener._handle(json.dumps(payload))
+        listener._handle("not json")
+        return await subscription.get(timeout=1)
+
+    event = asyncio.run(notify_and_receive())
+    stats = listener.stats()
+
+    assert event == {"type": "votes"}
+    assert stats["events_received"] == 1
+    assert stats["last_lag_ms"] >= 50
+    assert stats["max_lag_ms"] == stats["last_lag_ms"]
@@ -0,0 +1,138 @@
+"""Tests for signed participant tokens on the vote endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+from app.services import session_tokens
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    session_tokens.room_keys.clear()
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool; keep their tokens."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    tokens = {}
+    for name in ("Alice", "Bob"):
+        response = client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+        tokens[name] = response.json()["token"]
+    client.cookies.clear()
+
+    response = client.get(f"/api/v1/movies?code={room_code}")
+    movies = response.json()["movies"]
+    if len(movies) < 2:
+        pytest.skip("Not enough movies available")
+    return {"code": room_code, "tokens": tokens, "movie_ids": [m["id"] for m in movies]}
+
+
+def vote(client, room_code, movie_id, token=None, session_id=None):
+    return client.post(
+        f"/api/v1/votes?code={room_code}",
+        json={"movie_id": movie_id, "liked": True},
+        headers={"Authorization": f"Bearer {token}"} if token else {},
+        cookies={"session_id": session_id} if session_id else {},
+    )
+
+
+class TestSessionTokens:
+    """Tests for voting with a token instead of the session cookie."""
+
+    def test_token_alone_authorizes_votes(self, client, room):
+        first = vote(client, room["code"], room["movie_ids"][0], token=room["tokens"]["Alice"])
+        second = vote(client, room["code"], room["movie_ids"][0], token=room["tokens"]["Bob"])
+
+        assert first.status_code == 200
+        assert second.json()["matched"] is True
+        assert first.json()["participant_id"] != second.json()["participant_id"]
+
+    def test_token_skips_room_and_participant_lookups(self, client, room, query_budget):
+        vote(client, room["code"], room["movie_ids"][0], token=room["tokens"]["Alice"])
+
+        # Version bump and upsert; plus pg_notify
+        with query_budget(3):
+            response = vote(
+                client, room["code"], room["movie_ids"][1], token=room["tokens"]["Alice"]
+            )
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize(
+        "tamper",
+        [
+            lambda token: token[:-1] + ("A" if token[-1] != "A" else "B"),
+            lambda token: token.replace(".", ".9", 1),
+            lambda token: "not-a-token",
+        ],
+    )
+    def test_invalid_token_is_rejected(self, client, room, tamper):
+        response = vote(
+            client, room["code"], room["movie_ids"][0], token=tamper(room["tokens"]["Alice"])
+        )
+
+        assert response.status_code == 403
+
+    def test_token_is_bound_to_its_room(self, client, room):
+        response = client.post("/api/v1/rooms")
+        other_code = response.json()["code"]
+
+        response = vote(client, other_code, room["movie_ids"][0], token=room["tokens"]["Alice"])
+
+        assert response.status_code == 403
+
+    def test_expired_token_is_rejected(self, client, room, monkeypatch):
+        monkeypatch.setattr(session_tokens, "SESSION_TOKEN_TTL_SECONDS", -1)
+        response = client.post(
+            f"/api/v1/rooms/{room['code']}/join",
+            json={"name": "Alice"},
+            cookies={"session_id": "alice-session"},
+        )
+        client.cookies.clear()
+
+        response = vote(client, room["code"], room["movie_ids"][0], token=response.json()["token"])
+
+        assert response.status_code == 403
+
+    def test_rotation_revokes_tokens_but_not_cookies(self, client, room):
+        response = client.post(
+            f"/api/v1/rooms/{room['code']}/token-key/rotate",
+            cookies={"session_id": "alice-session"},
+        )
+        assert response.status_code == 200
+        new_token = response.json()["token"]
+        client.cookies.clear()
+
+        revoked = vote(client, room["code"], room["movie_ids"][0], token=room["tokens"]["Bob"])
+        fallback = vote(
+            client,
+            room["code"],
+            room["movie_ids"][0],
+            token=room["tokens"]["Bob"],
+            session_id="bob-session",
+        )
+        renewed = vote(client, room["code"], room["movie_ids"][1], token=new_token)
+
+        assert revoked.status_code == 403
+        assert fallback.status_code == 200
+        assert renewed.status_code == 200
+
+    def test_rotation_requires_the_session_cookie(self, client, room):
+        response = client.post(
+            f"/api/v1/rooms/{room['code']}/token-key/rotate",
+            headers={"Authorization": f"Bearer {room['tokens']['Alice']}"},
+        )
+
+        assert response.status_code == 403
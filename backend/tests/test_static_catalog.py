@@ -0,0 +1,84 @@
+"""Tests for seeding the static movie catalog when TMDB is not configured."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Movie, MovieAvailability, StaticCatalogSeed
+from app.services.static_catalog import STATIC_MOVIES, seed_static_catalog
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(client):
+    with SessionLocal() as session:
+        yield session
+
+
+def availabilities(db, region, provider_id):
+    return (
+        db.query(MovieAvailability)
+        .filter(MovieAvailability.region == region, MovieAvailability.provider_id == provider_id)
+        .count()
+    )
+
+
+class TestStaticCatalogSeeding:
+    """Tests for seed_static_catalog."""
+
+    def test_startup_seeds_the_default_region_and_provider(self, db):
+        assert db.query(Movie).count() == len(STATIC_MOVIES)
+        assert availabilities(db, "US", 8) == len(STATIC_MOVIES)
+        assert db.query(StaticCatalogSeed.region, StaticCatalogSeed.provider_id).all() == [
+            ("US", 8)
+        ]
+
+    def test_seeded_providers_cost_one_lookup(self, db, query_budget):
+        with query_budget(1):
+            assert seed_static_catalog(db, "US", [8]) is False
+
+    def test_new_providers_are_seeded_in_bulk(self, db, query_budget):
+        # Marker lookup, movie check, one INSERT ... SELECT per provider, markers; plus lock
+        with query_budget(6):
+            assert seed_static_catalog(db, "FR", [8, 337]) is True
+
+        assert db.query(Movie).count() == len(STATIC_MOVIES)
+        assert availabilities(db, "FR", 8) == len(STATIC_MOVIES)
+        assert availabilities(db, "FR", 337) == len(STATIC_MOVIES)
+        assert seed_static_catalog(db, "FR", [337, 8]) is False
+
+    def test_pairs_seeded_before_the_markers_are_not_duplicated(self, db):
+        db.query(StaticCatalogSeed).delete()
+        db.commit()
+
+        assert seed_static_catalog(db, "US", [8]) is True
+
+        assert availabilities(db, "US", 8) == len(STATIC_MOVIES)
+
+    def test_short_pool_does_not_rescan_the_catalog(self, client, query_budget):
+        response = client.post("/api/v1/rooms")
+        room_code = response.json()["code"]
+        response = client.post(f"/api/v1/rooms/{room_code}/join", json={"name": "Alice"})
+        url = f"/api/v1/movies/unvoted?code={room_code}&participant_id={response.json()['id']}"
+        movies = client.get(url).json()["movies"]
+        client.post(
+            f"/api/v1/votes/batch?code={room_code}",
+            json=[{"movie_id": movie["id"], "liked": False} for movie in movies],
+        )
+
+        # Room, participant, pool count, seed marker; room and page of the stream
+        with query_budget(6) as statements:
+            response = client.get(url)
+
+        assert len(movies) == len(STATIC_MOVIES)
+        assert response.json()["movies"] == []
+        assert not any("INSERT" in statement for statement in statements)
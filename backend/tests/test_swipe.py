@@ -0,0 +1,118 @@
+"""Tests for the combined vote-and-deck swipe endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    response = client.get(f"/api/v1/movies?code={room_code}")
+    movies = response.json()["movies"]
+    if len(movies) < 5:
+        pytest.skip("Not enough movies available")
+    return {"code": room_code, "movie_ids": [m["id"] for m in movies]}
+
+
+def swipe(client, room, session_id, movie_id, liked=True, **params):
+    return client.post(
+        f"/api/v1/rooms/{room['code']}/swipe",
+        params=params,
+        json={"movie_id": movie_id, "liked": liked},
+        cookies={"session_id": session_id},
+    )
+
+
+class TestSwipe:
+    """Tests for POST /api/v1/rooms/{code}/swipe."""
+
+    def test_records_the_vote_and_returns_the_next_movies(self, client, room):
+        first = room["movie_ids"][0]
+
+        response = swipe(client, room, "alice-session", first, limit=3)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["vote"]["movie_id"] == first
+        assert data["match"] is None
+        assert [m["id"] for m in data["next_movies"]] == room["movie_ids"][1:4]
+
+    def test_returns_the_match_completed_by_the_vote(self, client, room):
+        first = room["movie_ids"][0]
+        swipe(client, room, "alice-session", first)
+
+        response = swipe(client, room, "bob-session", first)
+
+        data = response.json()
+        assert data["vote"]["matched"] is True
+        assert data["match"]["movie"]["id"] == first
+        assert set(data["match"]["participants"]) == {"Alice", "Bob"}
+
+    def test_repeated_vote_on_a_match_completes_nothing(self, client, room):
+        first = room["movie_ids"][0]
+        swipe(client, room, "alice-session", first)
+        swipe(client, room, "bob-session", first)
+
+        response = swipe(client, room, "bob-session", first)
+
+        assert response.json()["vote"]["matched"] is True
+        assert response.json()["match"] is None
+
+    def test_deck_excludes_only_the_participants_own_votes(self, client, room):
+        first, second, third = room["movie_ids"][:3]
+        swipe(client, room, "bob-session", second)
+        client.post(
+            f"/api/v1/votes?code={room['code']}",
+            json={"movie_id": third, "liked": False},
+            cookies={"session_id": "alice-session"},
+        )
+
+        response = swipe(client, room, "alice-session", first, limit=2)
+
+        assert [m["id"] for m in response.json()["next_movies"]] == [second, room["movie_ids"][3]]
+
+    def test_after_continues_behind_the_clients_deck(self, client, room):
+        movie_ids = room["movie_ids"]
+
+        response = swipe(client, room, "alice-session", movie_ids[0], limit=2, after=movie_ids[2])
+
+        assert [m["id"] for m in response.json()["next_movies"]] == movie_ids[3:5]
+
+    def test_zero_limit_only_records_the_vote(self, client, room):
+        first = room["movie_ids"][0]
+
+        response = swipe(client, room, "alice-session", first, limit=0)
+
+        assert response.status_code == 200
+        assert response.json()["vote"]["movie_id"] == first
+        assert response.json()["next_movies"] == []
+
+    def test_non_participant_is_rejected(self, client, room):
+        response = swipe(client, room, "stranger-session", room["movie_ids"][0])
+
+        assert response.status_code == 403
+
+    def test_unknown_room_is_not_found(self, client, room):
+        response = swipe(client, {"code": "NOPE"}, "alice-session", room["movie_ids"][0])
+
+        assert response.status_code == 404
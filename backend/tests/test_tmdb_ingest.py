@@ -0,0 +1,195 @@
+"""Tests for storing the movies of a TMDB discover page."""
+
+import threading
+import time
+
+import pytest
+
+from app.database import Base, SessionLocal, engine
+from app.models import Movie
+from app.routers import movies
+from app.services import tmdb
+
+
+@pytest.fixture
+def db():
+    """A session on a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def genre_requests(monkeypatch):
+    """Fake TMDB genre list requests on an empty in-process catalog; records the languages."""
+    languages = []
+
+    def fake_request(endpoint, params=None, client=None):
+        assert endpoint == "/genre/movie/list"
+        languages.append(params["language"])
+        names = {"en-US": ("Drama", "Crime"), "fr-FR": ("Drame", "Crime")}[params["language"]]
+        return {"genres": [{"id": 18, "name": names[0]}, {"id": 80, "name": names[1]}]}
+
+    monkeypatch.setattr(tmdb, "_make_request", fake_request)
+    tmdb.genre_catalog.clear()
+    yield languages
+    tmdb.genre_catalog.clear()
+
+
+def discover_page(*tmdb_ids):
+    return [
+        {"id": tmdb_id, "title": f"Movie {tmdb_id}", "vote_average": 7.5, "genre_ids": [18, 99]}
+        for tmdb_id in tmdb_ids
+    ]
+
+
+def store(db, tmdb_id):
+    movie = Movie(tmdb_id=tmdb_id, title=f"Stored {tmdb_id}")
+    db.add(movie)
+    db.commit()
+    return movie.id
+
+
+class TestIngestDiscoverPage:
+    """Tests for _ingest_discover_page."""
+
+    @pytest.fixture(autouse=True)
+    def scheduled(self, db, genre_requests, monkeypatch):
+        """Count the hydration worker wake-ups instead of waking it; load the genres."""
+        wakeups = []
+        monkeypatch.setattr(movies.hydrator, "schedule", lambda: wakeups.append(True))
+        tmdb.genre_catalog.names(db)
+        return wakeups
+
+    def test_resolves_known_movies_and_inserts_the_rest(self, db, query_budget, scheduled):
+        known_id = store(db, 102)
+
+        # One IN query for the known movies, one INSERT for the new ones
+        with query_budget(2):
+            movie_ids, inserted = movies._ingest_discover_page(db, discover_page(101, 102, 103))
+
+        stored = {m.tmdb_id: m for m in db.query(Movie)}
+        assert inserted == 2
+        assert movie_ids == [stored[101].id, known_id, stored[103].id]
+        assert stored[101].title == "Movie 101"
+        assert stored[101].rating == 75
+        assert stored[101].genre == "Drama"
+        assert stored[101].hydrated_at is None
+        assert scheduled == [True]
+
+    def test_known_page_inserts_nothing(self, db, query_budget, scheduled):
+        movies._ingest_discover_page(db, discover_page(101, 102))
+        scheduled.clear()
+
+        with query_budget(1):
+            movie_ids, inserted = movies._ingest_discover_page(db, discover_page(101, 102))
+
+        assert inserted == 0
+        assert len(movie_ids) == 2
+        assert scheduled == []
+
+    def test_movie_inserted_concurrently_is_reused(self, db, monkeypatch):
+        concurrent_ids = {}
+        to_row = movies._tmdb_movie_row
+
+        def concurrent_insert(tmdb_movie, genre_names):
+            # Another room stores the same movie between our lookup and our insert
+            if tmdb_movie["id"] == 102:
+                other = SessionLocal()
+                concurrent_ids[102] = store(other, 102)
+                other.close()
+            return to_row(tmdb_movie, genre_names)
+
+        monkeypatch.setattr(movies, "_tmdb_movie_row", concurrent_insert)
+
+        movie_ids, inserted = movies._ingest_discover_page(db, discover_page(101, 102))
+
+        assert inserted == 1
+        assert movie_ids[1] == concurrent_ids[102]
+        assert db.query(Movie).filter(Movie.tmdb_id == 102).count() == 1
+
+
+class TestGenreCatalog:
+    """Tests for naming genre ids from the cached TMDB genre list."""
+
+    def test_fetches_each_language_once(self, db, genre_requests, query_budget):
+        assert tmdb.genre_catalog.names(db) == {18: "Drama", 80: "Crime"}
+        assert tmdb.genre_catalog.names(db, "fr-FR")[18] == "Drame"
+
+        with query_budget(0):
+            tmdb.genre_catalog.names(db)
+            tmdb.genre_catalog.names(db, "fr-FR")
+
+        assert genre_requests == ["en-US", "fr-FR"]
+
+    def test_other_processes_read_the_database_cache(self, db, genre_requests):
+        tmdb.genre_catalog.names(db)
+        tmdb.genre_catalog.clear()
+
+        assert tmdb.genre_catalog.names(db) == {18: "Drama", 80: "Crime"}
+        assert genre_requests == ["en-US"]
+
+    def test_page_is_stored_without_genres_when_the_list_is_unavailable(self, db, monkeypatch):
+        def unavailable(endpoint, params=None, client=None):
+            raise RuntimeError("TMDB request failed")
+
+        tmdb.genre_catalog.clear()
+        monkeypatch.setattr(tmdb, "_make_request", unavailable)
+        monkeypatch.setattr(movies.hydrator, "schedule", lambda: None)
+
+        movies._ingest_discover_page(db, discover_page(101))
+
+        assert db.query(Movie.genre).scalar() == ""
+
+
+class TestMoviesDetails:
+    """Tests for fetching the details of a page's new movies."""
+
+    @pytest.fixture
+    def detail_requests(self, monkeypatch):
+        """Fake TMDB detail requests that take a while; record how many overlap."""
+        calls = {"in_flight": 0, "max_in_flight": 0, "threads": set()}
+        lock = threading.Lock()
+
+        def fake_request(endpoint, params=None, client=None):
+            tmdb_id = int(endpoint.split("/")[2])
+            with lock:
+                calls["in_flight"] += 1
+                calls["max_in_flight"] = max(calls["max_in_flight"], calls["in_flight"])
+                calls["threads"].add(threading.get_ident())
+            time.sleep(0.05)
+            with lock:
+                calls["in_flight"] -= 1
+            if tmdb_id == 13:
+                raise RuntimeError("TMDB request failed")
+            return {"id": tmdb_id, "genres": [{"name": "Drama"}]}
+
+        monkeypatch.setattr(tmdb, "_make_request", fake_request)
+        monkeypatch.setattr(tmdb, "TMDB_DETAIL_CONCURRENCY", 4)
+        return calls
+
+    def test_fetches_with_bounded_concurrency(self, db, detail_requests):
+        started = time.monotonic()
+        details = tmdb.get_movies_details(db, list(range(1, 9)))
+        elapsed = time.monotonic() - started
+
+        assert sorted(details) == list(range(1, 9))
+        assert detail_requests["max_in_flight"] == 4
+        assert threading.get_ident() not in detail_requests["threads"]
+        assert elapsed < 8 * 0.05
+
+    def test_caches_on_the_calling_thread_and_reuses_the_cache(self, db, detail_requests):
+        tmdb.get_movies_details(db, [1, 2])
+        detail_requests["threads"].clear()
+
+        details = tmdb.get_movies_details(db, [1, 2])
+
+        assert details[1]["genres"] == [{"name": "Drama"}]
+        assert detail_requests["threads"] == set()
+
+    def test_failed_fetches_are_left_out(self, db, detail_requests):
+        details = tmdb.get_movies_details(db, [12, 13])
+
+        assert list(details) == [12]
@@ -0,0 +1,91 @@
+"""Tests for paging through the movies a participant hasn't voted on."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    participants = {}
+    for name in ("Alice", "Bob"):
+        response = client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+        participants[name] = response.json()["id"]
+    response = client.get(f"/api/v1/movies?code={room_code}&limit=100")
+    movie_ids = [m["id"] for m in response.json()["movies"]]
+    if len(movie_ids) < 12:
+        pytest.skip("Not enough movies available")
+    return {"code": room_code, "participants": participants, "movie_ids": movie_ids}
+
+
+def get_unvoted(client, room, name, **params):
+    params = {"code": room["code"], "participant_id": room["participants"][name], **params}
+    return client.get("/api/v1/movies/unvoted", params=params)
+
+
+class TestUnvotedMovies:
+    """Tests for GET /api/v1/movies/unvoted."""
+
+    def test_excludes_only_the_participants_votes(self, client, room):
+        first, second = room["movie_ids"][:2]
+        client.post(
+            f"/api/v1/votes/batch?code={room['code']}",
+            json=[{"movie_id": first, "liked": True}],
+            cookies={"session_id": "alice-session"},
+        )
+        client.post(
+            f"/api/v1/votes/batch?code={room['code']}",
+            json=[{"movie_id": second, "liked": True}],
+            cookies={"session_id": "bob-session"},
+        )
+
+        response = get_unvoted(client, room, "Alice", limit=3)
+
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()["movies"]] == [second, *room["movie_ids"][2:4]]
+
+    def test_pages_cover_the_pool_exactly_once(self, client, room):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 5, **({"cursor": cursor} if cursor else {})}
+            data = get_unvoted(client, room, "Alice", **params).json()
+            seen += [m["id"] for m in data["movies"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == room["movie_ids"]
+
+    def test_limit_is_capped(self, client, room):
+        response = get_unvoted(client, room, "Alice", limit=501)
+
+        assert response.status_code == 422
+
+    def test_participant_of_another_room_is_not_found(self, client, room):
+        response = client.post("/api/v1/rooms")
+        other_code = response.json()["code"]
+
+        response = client.get(
+            "/api/v1/movies/unvoted",
+            params={"code": other_code, "participant_id": room["participants"]["Alice"]},
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,127 @@
+"""Tests for recording several votes in one request."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room_code = response.json()["code"]
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room_code}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    response = client.get(f"/api/v1/movies?code={room_code}")
+    movies = response.json()["movies"]
+    if len(movies) < 5:
+        pytest.skip("Not enough movies available")
+    return {"code": room_code, "movie_ids": [m["id"] for m in movies[:5]]}
+
+
+def post_batch(client, room, session_id, votes):
+    return client.post(
+        f"/api/v1/votes/batch?code={room['code']}",
+        json=[{"movie_id": movie_id, "liked": liked} for movie_id, liked in votes],
+        cookies={"session_id": session_id},
+    )
+
+
+class TestVoteBatch:
+    """Tests for POST /api/v1/votes/batch."""
+
+    def test_records_every_vote(self, client, room):
+        votes = [(movie_id, i % 2 == 0) for i, movie_id in enumerate(room["movie_ids"])]
+
+        response = post_batch(client, room, "alice-session", votes)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [(v["movie_id"], v["liked"]) for v in data["votes"]] == votes
+        assert data["matches"] == []
+
+        response = client.get(f"/api/v1/movies?code={room['code']}")
+        remaining = {m["id"] for m in response.json()["movies"]}
+        assert remaining.isdisjoint(room["movie_ids"])
+
+    def test_returns_matches_completed_by_the_batch(self, client, room):
+        first, second, third = room["movie_ids"][:3]
+        post_batch(client, room, "alice-session", [(first, True), (second, True)])
+
+        response = post_batch(
+            client, room, "bob-session", [(first, True), (second, False), (third, True)]
+        )
+
+        data = response.json()
+        assert {v["movie_id"]: v["matched"] for v in data["votes"]} == {
+            first: True,
+            second: False,
+            third: False,
+        }
+        assert [m["movie"]["id"] for m in data["matches"]] == [first]
+        assert set(data["matches"][0]["participants"]) == {"Alice", "Bob"}
+
+        response = client.get(f"/api/v1/votes/matches?code={room['code']}")
+        assert [m["movie"]["id"] for m in response.json()] == [first]
+
+    def test_retried_batch_reports_no_match_again(self, client, room):
+        movie_id = room["movie_ids"][0]
+        post_batch(client, room, "alice-session", [(movie_id, True)])
+        post_batch(client, room, "bob-session", [(movie_id, True)])
+
+        response = post_batch(client, room, "alice-session", [(movie_id, True)])
+
+        data = response.json()
+        assert data["votes"][0]["matched"] is True
+        assert data["matches"] == []
+
+    def test_last_vote_on_a_movie_wins(self, client, room):
+        movie_id = room["movie_ids"][0]
+        post_batch(client, room, "bob-session", [(movie_id, True)])
+
+        response = post_batch(client, room, "alice-session", [(movie_id, True), (movie_id, False)])
+
+        data = response.json()
+        assert len(data["votes"]) == 1
+        assert data["votes"][0]["liked"] is False
+        assert data["matches"] == []
+
+    def test_updates_existing_votes(self, client, room, query_budget):
+        movie_ids = room["movie_ids"]
+        post_batch(client, room, "alice-session", [(movie_id, False) for movie_id in movie_ids])
+
+        # Room, participant, version, one upsert; plus pg_notify
+        with query_budget(5):
+            response = post_batch(
+                client, room, "alice-session", [(movie_id, True) for movie_id in movie_ids]
+            )
+
+        assert response.status_code == 200
+        assert len({v["id"] for v in response.json()["votes"]}) == len(movie_ids)
+
+    def test_non_participant_is_rejected(self, client, room):
+        response = post_batch(client, room, "stranger-session", [(room["movie_ids"][0], True)])
+
+        assert response.status_code == 403
+
+    def test_oversized_batch_is_rejected(self, client, room):
+        votes = [(room["movie_ids"][0], True)] * 101
+
+        response = post_batch(client, room, "alice-session", votes)
+
+        assert response.status_code == 400
@@ -0,0 +1,150 @@
+"""Tests for the in-memory room vote bitmaps."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Vote
+from app.services.room_version import bump_room_version
+from app.services.vote_index import RoomVotes, VoteIndex, vote_index
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a fresh database."""
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as c:
+        yield c
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def room(client):
+    """Create a room with two participants and a seeded movie pool."""
+    response = client.post("/api/v1/rooms")
+    room = response.json()
+    for name in ("Alice", "Bob"):
+        client.post(
+            f"/api/v1/rooms/{room['code']}/join",
+            json={"name": name},
+            cookies={"session_id": f"{name.lower()}-session"},
+        )
+    response = client.get(f"/api/v1/movies?code={room['code']}")
+    movies = response.json()["movies"]
+    if len(movies) < 2:
+        pytest.skip("Not enough movies available")
+    return {"id": room["id"], "code": room["code"], "movies": movies}
+
+
+def vote(client, room, session_id, movie_id, liked=True):
+    response = client.post(
+        f"/api/v1/votes?code={room['code']}",
+        json={"movie_id": movie_id, "liked": liked},
+        cookies={"session_id": session_id},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestRoomVotes:
+    """Tests for the bitmaps of a single room."""
+
+    def test_match_needs_every_participant_to_like(self):
+        room = RoomVotes(version=0, participant_ids=[1, 2])
+        room.apply(1, movie_id=10, liked=True)
+        assert not room.is_match(10)
+
+        room.apply(2, movie_id=10, liked=True)
+        assert room.is_match(10)
+
+        room.apply(2, movie_id=10, liked=False)
+        assert not room.is_match(10)
+        assert room.vote_count(2) == 1
+
+    def test_single_participant_never_matches(self):
+        room = RoomVotes(version=0, participant_ids=[1])
+        room.apply(1, movie_id=10, liked=True)
+
+        assert not room.is_match(10)
+        assert not room.is_match(11)
+
+
+class TestVoteIndex:
+    """Tests for the index as maintained by vote recording."""
+
+    def test_votes_are_applied_without_rebuilding(self, client, room):
+        first, second = (m["id"] for m in room["movies"][:2])
+
+        vote(client, room, "alice-session", first)  # cold miss
+        before = vote_index.stats()
+        vote(client, room, "bob-session", second, liked=False)
+        result = vote(client, room, "bob-session", first)
+
+        stats = vote_index.stats()
+        assert result["matched"] is True
+        assert stats["rebuilds"] == before["rebuilds"]
+        assert stats["hits"] == before["hits"] + 2
+
+    def test_write_from_elsewhere_triggers_rebuild(self, client, room):
+        """A vote that bypassed this process is picked up from the votes table."""
+        movie_id = room["movies"][0]["id"]
+        vote(client, room, "alice-session", room["movies"][1]["id"])
+        bob = vote(client, room, "bob-session", room["movies"][1]["id"], liked=False)
+
+        db = SessionLocal()
+        try:
+            db.add(
+                Vote(
+                    room_id=room["id"],
+                    participant_id=bob["participant_id"],
+                    movie_id=movie_id,
+                    liked=True,
+                )
+            )
+            bump_room_version(db, room["id"])
+            db.commit()
+        finally:
+            db.close()
+
+        before = vote_index.stats()
+        result = vote(client, room, "alice-session", movie_id)
+
+        assert result["matched"] is True
+        assert vote_index.stats()["rebuilds"] == before["rebuilds"] + 1
+
+    def test_changed_vote_is_not_counted_twice(self, client, room):
+        first, second = (m["id"] for m in room["movies"][:2])
+        vote(client, room, "alice-session", first)
+        vote(client, room, "alice-session", first, liked=False)
+        alice = vote(client, room, "alice-session", second)
+
+        cached = vote_index._get(room["id"])
+        assert cached is not None
+        assert cached.vote_count(alice["participant_id"]) == 2
+        assert not cached.is_match(first)
+
+
+def test_least_recently_used_room_is_evicted():
+    index = VoteIndex(max_bytes=1)
+    for room_id in (1, 2):
+        index._install(room_id, RoomVotes(version=0, participant_ids=[1, 2]))
+
+    stats = index.stats()
+    assert stats["rooms"] == 1
+    assert stats["evictions"] == 1
+    assert index._get(2) is not None
+
+
+def test_vote_already_in_a_rebuilt_room_may_have_undone_a_match():
+    """Another thread rebuilt the room after Alice's un-like of a match committed."""
+    index = VoteIndex()
+    rebuilt = RoomVotes(version=5, participant_ids=[1, 2])
+    rebuilt.apply(1, movie_id=10, liked=False)
+    rebuilt.apply(2, movie_id=10, liked=True)
+    index._install(1, rebuilt)
+
+    outcome = index.record(None, room_id=1, version=5, participant_id=1, votes=[(10, False)])
+
+    assert outcome.changes[0].was_match is True
+    assert outcome.changes[0].is_match is False
@@ -62,10 +62,11 @@ describe('Match Notification Flow', () => {
         });
       }
 
-      if (url.includes('/api/v1/votes?code=TEST')) {
+      if (url.includes('/api/v1/rooms/TEST/swipe')) {
         return Promise.resolve({
           ok: true,
-          json: () => Promise.resolve({ id: 1, liked: true }),
+          json: () =>
+            Promise.resolve({ vote: { id: 1, liked: true }, match: mockMatch, next_movies: [] }),
         });
       }
 
@@ -85,10 +86,10 @@ describe('Match Notification Flow', () => {
     const likeButton = screen.getByText('Like');
     fireEvent.click(likeButton);
 
-    // Wait for vote to be processed
+    // Wait for vote to be processed; the only card was swiped, so a full buffer is asked for
     await waitFor(() => {
       expect(mockFetch).toHaveBeenCalledWith(
-        '/api/v1/votes?code=TEST',
+        expect.stringContaining('/api/v1/rooms/TEST/swipe?after=1&limit=10'),
         expect.objectContaining({
           method: 'POST',
           body: JSON.stringify({ movie_id: 1, liked: true }),
@@ -128,7 +129,7 @@ describe('Match Notification Flow', () => {
         });
       }
 
-      if (url.includes('/api/v1/votes?code=TEST')) {
+      if (url.includes('/api/v1/rooms/TEST/swipe')) {
         // Simulate match being created after vote
         matchesCount = 1;
         return Promise.resolve({
@@ -158,7 +159,7 @@ describe('Match Notification Flow', () => {
     // Wait for vote to process
     await waitFor(() => {
       expect(mockFetch).toHaveBeenCalledWith(
-        '/api/v1/votes?code=TEST',
+        expect.stringContaining('/api/v1/rooms/TEST/swipe'),
         expect.any(Object)
       );
     });
@@ -195,7 +196,7 @@ describe('Match Notification Flow', () => {
         });
       }
 
-      if (url.includes('/api/v1/votes?code=TEST')) {
+      if (url.includes('/api/v1/rooms/TEST/swipe')) {
         return Promise.resolve({ ok: true, json: () => Promise.resolve({}) });
       }
 
@@ -0,0 +1,15 @@
+// Participant tokens returned by the join endpoint, kept per room for this tab.
+// Votes send them as a bearer token; without one the session cookie is used.
+
+const storageKey = (code: string) => `cinematch:room-token:${code}`;
+
+export function rememberRoomToken(code: string, participant: { token?: string | null }) {
+  if (typeof sessionStorage === "undefined" || !participant?.token) return;
+  sessionStorage.setItem(storageKey(code), participant.token);
+}
+
+export function roomAuthHeaders(code: string): Record<string, string> {
+  if (typeof sessionStorage === "undefined") return {};
+  const token = sessionStorage.getItem(storageKey(code));
+  return token ? { Authorization: `Bearer ${token}` } : {};
+}
@@ -5,6 +5,7 @@ import { useRouter } from "next/navigation";
 import { Film, ChevronLeft } from "lucide-react";
 import PlatformSelector from "./components/PlatformSelector";
 import RegionSelector from "./components/RegionSelector";
+import { rememberRoomToken } from "./lib/roomToken";
 
 type Step = "name" | "platform" | "creating";
 
@@ -34,11 +35,12 @@ export default function Home() {
       });
       const data = await response.json();
 
-      await fetch(`/api/v1/rooms/${data.code}/join`, {
+      const joinResponse = await fetch(`/api/v1/rooms/${data.code}/join`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ name: name.trim() }),
       });
+      rememberRoomToken(data.code, await joinResponse.json());
 
       router.push(`/room/${data.code}`);
     } catch (error) {
@@ -61,6 +63,7 @@ export default function Home() {
       if (!response.ok) {
         throw new Error("Failed to join room");
       }
+      rememberRoomToken(roomCode.trim(), await response.json());
 
       router.push(`/room/${roomCode.trim()}`);
     } catch (error) {
@@ -1,8 +1,9 @@
 "use client";
 
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import { useParams } from "next/navigation";
 import { Check, Copy, Heart, X, Info, Star, Play, RefreshCw } from "lucide-react";
+import { roomAuthHeaders } from "../../lib/roomToken";
 
 interface Movie {
   id: number;
@@ -49,6 +50,12 @@ const PROVIDER_INFO: Record<number, { name: string; color: string }> = {
   15: { name: "Hulu", color: "bg-green-500" },
 };
 
+// Unseen cards the deck is kept topped up to while swiping
+const DECK_BUFFER_SIZE = 10;
+
+// How long to wait before asking again for movies the server is still fetching
+const POOL_FILLING_RETRY_MS = 1000;
+
 export default function RoomPage() {
   const params = useParams();
   const code = params.code as string;
@@ -62,16 +69,42 @@ export default function RoomPage() {
   const [loading, setLoading] = useState(true);
   const [finished, setFinished] = useState(false);
   const [copied, setCopied] = useState(false);
-  const [previousMatchIds, setPreviousMatchIds] = useState<Set<number>>(new Set());
   const [imageLoading, setImageLoading] = useState(true);
   const [imageError, setImageError] = useState(false);
   const [isFetchingMore, setIsFetchingMore] = useState(false);
+  const finishedRef = useRef(false);
+  const seenMatchIds = useRef<Set<number>>(new Set());
+
+  const poolRetry = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const poolRetryStopped = useRef(false);
 
+  // Called on load, and again while the server is filling the room's pool
   const fetchMovies = useCallback(async () => {
+    if (poolRetry.current) clearTimeout(poolRetry.current);
+    poolRetry.current = null;
     try {
       const response = await fetch(`/api/v1/movies?code=${code}`);
       const data = await response.json();
-      setMovies(data.movies);
+      if (data.pool_filling && !poolRetryStopped.current) {
+        // The server is still fetching movies for the room; ask again shortly
+        poolRetry.current = setTimeout(fetchMovies, POOL_FILLING_RETRY_MS);
+      }
+      if (data.pool_filling && data.movies.length === 0) return;
+
+      if (finishedRef.current) {
+        // Out of cards: deal the new movies from the start
+        if (data.movies.length > 0) {
+          setMovies(data.movies);
+          setCurrentIndex(0);
+          setFinished(false);
+        }
+      } else {
+        // Keep the cards already dealt; add the movies the deck does not hold yet
+        setMovies((current) => {
+          const known = new Set(current.map((m) => m.id));
+          return [...current, ...data.movies.filter((m: Movie) => !known.has(m.id))];
+        });
+      }
       setRoom(data.room);
       setLoading(false);
     } catch (error) {
@@ -98,34 +131,54 @@ export default function RoomPage() {
     }
   }, [code]);
 
-  const fetchMatches = useCallback(async () => {
-    try {
-      const response = await fetch(`/api/v1/votes/matches?code=${code}`);
-      const data = await response.json();
-
-      // Detect NEW matches by comparing with previously seen match IDs
-      const currentMatchIds = new Set<number>(data.map((m: Match) => m.movie.id));
-      const newMatches = data.filter(
-        (m: Match) => !previousMatchIds.has(m.movie.id)
-      );
-
-      // If there are new matches, show the first one immediately
-      if (newMatches.length > 0 && !finished) {
-        setShowMatch(newMatches[0]);
-      }
+  // Matches arrive both from the stream and from our own swipes; show each once
+  const announceMatch = useCallback((match: Match) => {
+    if (seenMatchIds.current.has(match.movie.id)) return;
+    seenMatchIds.current.add(match.movie.id);
 
-      // Update previous match IDs for next comparison
-      setPreviousMatchIds(currentMatchIds);
-      setMatches(data);
-    } catch (error) {
-      console.error("Failed to fetch matches:", error);
+    setMatches((current) => [...current, match]);
+    if (!finishedRef.current) {
+      setShowMatch(match);
     }
-  }, [code, previousMatchIds, finished]);
+  }, []);
 
+  // Subscribe once per room: the server replays existing matches, then pushes new ones.
+  // EventSource reconnects on its own and resumes via Last-Event-ID.
   useEffect(() => {
+    if (typeof EventSource === "undefined") return;
+
+    const source = new EventSource(`/api/v1/votes/matches/stream?code=${code}`);
+    source.addEventListener("match", (event) => {
+      announceMatch(JSON.parse((event as MessageEvent).data));
+    });
+    // A participant changed their vote: the movie is no longer a match
+    source.addEventListener("unmatch", (event) => {
+      const { movie_id: movieId } = JSON.parse((event as MessageEvent).data);
+      seenMatchIds.current.delete(movieId);
+      setMatches((current) => current.filter((match) => match.movie.id !== movieId));
+      setShowMatch((shown) => (shown?.movie.id === movieId ? null : shown));
+    });
+    // A pool top-up added movies to the room
+    source.addEventListener("pool_updated", () => {
+      fetchMovies();
+    });
+
+    return () => source.close();
+  }, [code, announceMatch, fetchMovies]);
+
+  useEffect(() => {
+    poolRetryStopped.current = false;
     fetchMovies();
+    return () => {
+      poolRetryStopped.current = true;
+      if (poolRetry.current) clearTimeout(poolRetry.current);
+    };
   }, [fetchMovies]);
 
+  useEffect(() => {
+    finishedRef.current = finished;
+  }, [finished]);
+
   // Reset image state when movie changes
   useEffect(() => {
     setImageLoading(true);
@@ -137,15 +190,30 @@ export default function RoomPage() {
     if (!movie) return;
 
     try {
-      await fetch(`/api/v1/votes?code=${code}`, {
+      // Record the vote and top the deck back up to DECK_BUFFER_SIZE unseen cards
+      const lastId = movies[movies.length - 1].id;
+      const remaining = movies.length - currentIndex - 1;
+      const needed = Math.max(0, DECK_BUFFER_SIZE - remaining);
+      const response = await fetch(`/api/v1/rooms/${code}/swipe?after=${lastId}&limit=${needed}`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: { "Content-Type": "application/json", ...roomAuthHeaders(code) },
         body: JSON.stringify({ movie_id: movie.id, liked }),
       });
+      const data = await response.json();
+      const nextMovies: Movie[] = data?.next_movies ?? [];
 
-      await fetchMatches();
+      if (data?.match) {
+        announceMatch(data.match);
+      }
+
+      if (nextMovies.length > 0) {
+        setMovies((current) => {
+          const known = new Set(current.map((m) => m.id));
+          return [...current, ...nextMovies.filter((m) => !known.has(m.id))];
+        });
+      }
 
-      if (currentIndex < movies.length - 1) {
+      if (currentIndex < movies.length - 1 || nextMovies.length > 0) {
         setCurrentIndex(currentIndex + 1);
       } else {
         setFinished(true);
@@ -102,7 +102,7 @@ resource "aws_lb_listener_rule" "api" {
 
   condition {
     path_pattern {
-      values = ["/api/*", "/health"]
+      values = ["/api/*", "/ws/*", "/health"]
     }
   }
 }
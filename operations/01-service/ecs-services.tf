@@ -8,6 +8,12 @@ locals {
   ) : "sqlite:///app/data/cinematch.db"
 }
 
+# Shared by all backend tasks so a participant token verifies on any of them
+resource "random_password" "session_token_secret" {
+  length  = 64
+  special = false
+}
+
 # Backend Task Definition
 resource "aws_ecs_task_definition" "backend" {
   family                   = "cinematch-backend-${terraform.workspace}"
@@ -40,6 +46,10 @@ resource "aws_ecs_task_definition" "backend" {
         {
           name  = "RUN_MIGRATIONS"
           value = "true"
+        },
+        {
+          name  = "SESSION_TOKEN_SECRET"
+          value = random_password.session_token_secret.result
         }
       ]
       secrets = [